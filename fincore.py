@@ -144,14 +144,18 @@ But be aware that the notebook may be out of date.
 '''
 
 # Python.
+import os
 import sys
 import math
 import copy
+import bisect
+import calendar
 import types
 import typing as t
 import decimal
 import logging
 import datetime
+import operator
 import functools
 import itertools
 import contextlib
@@ -159,7 +163,6 @@ import dataclasses
 import importlib.metadata
 
 # Libs.
-import typeguard
 import dateutil.relativedelta
 
 # Fincore version (http://versioningit.readthedocs.io/en/stable/runtime-version.html).
@@ -174,15 +177,30 @@ _0 = decimal.Decimal()
 # One as decimal.
 _1 = decimal.Decimal(1)
 
+# Thirty as decimal, the days of a commercial month.
+_30 = decimal.Decimal(30)
+
+# One hundred as decimal.
+_100 = decimal.Decimal(100)
+
 # Centi factor.
 _CENTI = decimal.Decimal('0.01')
 
-# Centesimal quantization.
-_Q = functools.partial(decimal.Decimal.quantize, exp=_CENTI, rounding=decimal.ROUND_HALF_UP)
+# Centesimal quantization. Called a few times for every payment and every day, so it's a plain function, with positional
+# arguments. A partial of "decimal.Decimal.quantize", with keyword arguments, costs about three times as much per call.
+def _Q(value: decimal.Decimal) -> decimal.Decimal:
+    return value.quantize(_CENTI, decimal.ROUND_HALF_UP)
 
 # Generic type.
 _T = t.TypeVar('_T')
 
+# Generic callable type.
+_F = t.TypeVar('_F', bound=t.Callable[..., t.Any])
+
+# Runtime type checking of routines, with Typeguard. On by default. Set "FINCORE_TYPECHECK=0" to turn it off, in which
+# case the Typeguard package isn't even imported.
+_TYPECHECK = os.environ.get('FINCORE_TYPECHECK', '1').lower() not in ('0', 'false', 'no', 'off')
+
 # A month.
 _MONTH = dateutil.relativedelta.relativedelta(months=1)
 
@@ -202,26 +220,63 @@ _BRAZIL_TAX_BRACKETS = [
     (720, sys.maxsize, decimal.Decimal('0.15'))
 ]
 
+# Upper bounds and rates of the income tax table, as sorted parallel tuples, for a binary search on the brackets.
+_BRAZIL_TAX_EDGES = tuple(x[1] for x in _BRAZIL_TAX_BRACKETS)
+_BRAZIL_TAX_RATES = tuple(x[2] for x in _BRAZIL_TAX_BRACKETS)
+
+# IOF rates, in percent. A fixed rate, plus a daily rate, capped at the rate of a year long operation.
+_IOF_FIXED = decimal.Decimal('0.38')
+_IOF_DAILY = decimal.Decimal('0.00411')
+_IOF_CAP = decimal.Decimal('1.88')
+
 # Variable rate indexes.
 _VR_INDEX = t.Literal['CDI', 'Poupança']
 
 # Price level indexes.
 _PL_INDEX = t.Literal['IPCA', 'IGPM']
 
+# Price level indexes, codes. Looked up when validating every amortization of a schedule.
+_PL_INDEX_CODES = t.get_args(_PL_INDEX)
+
 # Price level indexes, range shifters: AUTO, M-1, M-2.
 _PL_SHIFT = t.Literal['AUTO', 'M-1', 'M-2']
 
+# Price level indexes, number of months each range shifter moves the range back.
+_PL_SHIFT_MONTHS = {x: i for i, x in enumerate(t.get_args(_PL_SHIFT))}
+
 # Capitalisation methods, daily and monthly. Defines how DP/DT calculations are performed.
 _CAPITALISATION = t.Literal['252', '360', '365', '30/360']
 
 # Daily capitalisation methods.
 _DAILY_CAPITALISATION = t.Literal['252', '360', '365']
 
+# Supported combinations of variable index and capitalisation. Checked once, before the periods of a schedule.
+_VIR_CAPITALISATIONS = frozenset({('CDI', '252'), ('Poupança', '360'), ('IPCA', '360'), ('IPCA', '30/360')})
+
+# Supported capitalisations of fixed interest rates.
+_FIXED_CAPITALISATIONS = frozenset({'360', '365', '30/360'})
+
 # Gain output mode.
 _GAIN_OUTPUT_MODE = t.Literal['current', 'deferred', 'settled']
 
+# Key of the amortizations, and of the insertions, interleaved by the preprocessors of schedules.
+_DATE_KEY = operator.attrgetter('date')
+
 # Helpers. {{{
-@typeguard.typechecked
+def _typechecked(func: _F) -> _F:
+    '''Applies "typeguard.typechecked" to a routine, unless runtime type checking is off (see "_TYPECHECK").'''
+
+    if _TYPECHECK:
+        import typeguard
+
+        return t.cast(_F, typeguard.typechecked(func))
+
+    return func
+
+# The private helpers of this module, and the operators of its internal classes, are not type checked. They are only
+# called by the module itself, with arguments that were already checked by the public routines, some of them on every
+# period or day of a schedule.
+#
 def _delta_months(d1: datetime.date, d2: datetime.date) -> int:
     '''
     Returns the number of months between two given dates, D1 and D2.
@@ -249,16 +304,97 @@ def _delta_months(d1: datetime.date, d2: datetime.date) -> int:
 
     return (d1.year - d2.year) * 12 + d1.month - d2.month
 
-@typeguard.typechecked
-def _date_range(start_date: datetime.date, end_date: datetime.date) -> t.Generator[datetime.date, None, None]:
-    iterator = start_date
+@functools.cache
+def _decimal(value: str) -> decimal.Decimal:
+    '''
+    Returns a decimal for a string, always the same object for the same string.
+
+    Decimals are immutable, so the large tables of indexes of this module can share them.
+
+    >>> _decimal('0.3715') is _decimal('0.3715')
+    True
+    '''
+
+    return decimal.Decimal(value)
+
+@functools.lru_cache(maxsize=4096)
+def _fraction(numerator: int, denominator: int) -> decimal.Decimal:
+    '''
+    Returns the fraction of two integers as a decimal, e.g., the fraction of a year, or of a month, in a period.
+
+    Schedules ask for the same few day count fractions over and over, hence the cache.
+
+    >>> _fraction(15, 360)
+    Decimal('0.04166666666666666666666666667')
+    >>> _fraction(31, 12 * 31)
+    Decimal('0.08333333333333333333333333333')
+    '''
+
+    return decimal.Decimal(numerator) / decimal.Decimal(denominator)
+
+@functools.cache
+def _percentage_ratio(percentage: int) -> decimal.Decimal:
+    '''
+    Returns a percentage as a ratio, e.g., the percentage of the CDI earned by a loan.
+
+    >>> _percentage_ratio(100)
+    Decimal('1')
+    >>> _percentage_ratio(115)
+    Decimal('1.15')
+    '''
+
+    return decimal.Decimal(percentage) / _100
+
+@functools.lru_cache(maxsize=4096)
+def _fractional_power(base: decimal.Decimal, exponent: decimal.Decimal) -> decimal.Decimal:
+    '''
+    Raises a base to a fractional exponent.
+
+    Decimal computes these powers through logarithms, which is expensive, and pro rata price level adjustments ask for
+    the same few powers over and over. Hence the cache.
+
+    >>> _fractional_power(decimal.Decimal('1.0054'), decimal.Decimal('0.5'))
+    Decimal('1.002696364808409984094882635')
+    '''
+
+    return base ** exponent
+
+def _add_months(base: datetime.date, months: int) -> datetime.date:
+    '''
+    Adds a number of months to a date. Same as "base + _MONTH * months", without building two relativedelta objects.
+
+    As with relativedelta, the day is clamped to the last day of the resulting month.
 
-    while iterator < end_date:
-        yield iterator
+    >>> from datetime import date
+    >>>
+    >>> _add_months(date(2024, 1, 31), 1)
+    datetime.date(2024, 2, 29)
+    >>> _add_months(date(2023, 12, 15), 14)
+    datetime.date(2025, 2, 15)
+    >>> _add_months(date(2023, 3, 31), -1)
+    datetime.date(2023, 2, 28)
+    '''
 
-        iterator += datetime.timedelta(days=1)
+    y, m = divmod(base.year * 12 + base.month - 1 + months, 12)
+
+    return base.replace(year=y, month=m + 1, day=min(base.day, calendar.monthrange(y, m + 1)[1]))
+
+def _date_range(start_date: datetime.date, end_date: datetime.date) -> t.Iterator[datetime.date]:
+    '''
+    Returns an iterator over the days from the start date, inclusive, up to the end date, exclusive.
+
+    Iterates on ordinals, and doesn't step on timedeltas.
+
+    >>> from datetime import date
+    >>>
+    >>> list(_date_range(date(2024, 2, 28), date(2024, 3, 2)))
+    [datetime.date(2024, 2, 28), datetime.date(2024, 2, 29), datetime.date(2024, 3, 1)]
+    >>> list(_date_range(date(2024, 3, 2), date(2024, 3, 2)))
+    []
+    '''
+
+    return map(datetime.date.fromordinal, range(start_date.toordinal(), end_date.toordinal()))
 
-@typeguard.typechecked
 def _generate_monthly_dates(date0: datetime.date, date1: datetime.date) -> t.Generator[t.Tuple[datetime.date, datetime.date], None, None]:
     index = date0
 
@@ -270,7 +406,7 @@ def _generate_monthly_dates(date0: datetime.date, date1: datetime.date) -> t.Gen
 
         index = next_date
 
-@typeguard.typechecked
+@functools.lru_cache(maxsize=4096)
 def _diff_surrounding_dates(base: datetime.date, day_of_month: int) -> int:
     '''
     Returns the amount of days between two dates derived from a base date.
@@ -320,8 +456,15 @@ def _diff_surrounding_dates(base: datetime.date, day_of_month: int) -> int:
     else:
         raise ValueError(f"can't find a date prior to the base of {base} on day {day_of_month}")
 
-@typeguard.typechecked
-def _interleave(a: t.Iterable[_T], b: t.Iterable[_T], *, key: t.Callable[..., t.Any] = lambda x: x) -> t.Generator[types.SimpleNamespace, None, None]:
+class _IlvItem:
+    '''An item produced by "_interleave". Has slots, so it is cheaper to build than a "types.SimpleNamespace".'''
+
+    __slots__ = ('index_a', 'from_a', 'index_b', 'from_b', 'item')
+
+    def __init__(self, index_a: int, from_a: bool, index_b: int, from_b: bool, item: t.Any) -> None:
+        self.index_a, self.from_a, self.index_b, self.from_b, self.item = index_a, from_a, index_b, from_b, item
+
+def _interleave(a: t.Iterable[_T], b: t.Iterable[_T], *, key: t.Callable[..., t.Any] = lambda x: x) -> t.Generator[_IlvItem, None, None]:
     '''
     Interleave two ordered iterables into another, also ordered, iterable.
 
@@ -433,7 +576,7 @@ def _interleave(a: t.Iterable[_T], b: t.Iterable[_T], *, key: t.Callable[..., t.
         if val_a and val_b and key(val_a) == key(val_b):
             sav_b = val_b
 
-            yield types.SimpleNamespace(index_a=idx_a, from_a=False, index_b=idx_b, from_b=True, item=val_b)
+            yield _IlvItem(idx_a, False, idx_b, True, val_b)
 
             with contextlib.suppress(StopIteration):
                 val_b = None
@@ -444,7 +587,7 @@ def _interleave(a: t.Iterable[_T], b: t.Iterable[_T], *, key: t.Callable[..., t.
         elif val_a and val_b and key(val_a) < key(val_b):
             sav_a = val_a
 
-            yield types.SimpleNamespace(index_a=idx_a, from_a=True, index_b=idx_b, from_b=False, item=val_a)
+            yield _IlvItem(idx_a, True, idx_b, False, val_a)
 
             with contextlib.suppress(StopIteration):
                 val_a = None
@@ -455,7 +598,7 @@ def _interleave(a: t.Iterable[_T], b: t.Iterable[_T], *, key: t.Callable[..., t.
         elif val_a and val_b:
             sav_b = val_b
 
-            yield types.SimpleNamespace(index_a=idx_a, from_a=False, index_b=idx_b, from_b=True, item=val_b)
+            yield _IlvItem(idx_a, False, idx_b, True, val_b)
 
             with contextlib.suppress(StopIteration):
                 val_b = None
@@ -466,7 +609,7 @@ def _interleave(a: t.Iterable[_T], b: t.Iterable[_T], *, key: t.Callable[..., t.
         elif val_a:
             sav_a = val_a
 
-            yield types.SimpleNamespace(index_a=idx_a, from_a=True, index_b=idx_b, from_b=False, item=val_a)
+            yield _IlvItem(idx_a, True, idx_b, False, val_a)
 
             with contextlib.suppress(StopIteration):
                 val_a = None
@@ -477,7 +620,7 @@ def _interleave(a: t.Iterable[_T], b: t.Iterable[_T], *, key: t.Callable[..., t.
         else:
             sav_b = val_b
 
-            yield types.SimpleNamespace(index_a=idx_a, from_a=False, index_b=idx_b, from_b=True, item=val_b)
+            yield _IlvItem(idx_a, False, idx_b, True, val_b)
 
             with contextlib.suppress(StopIteration):
                 val_b = None
@@ -485,7 +628,7 @@ def _interleave(a: t.Iterable[_T], b: t.Iterable[_T], *, key: t.Callable[..., t.
 
                 idx_b += 1
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class FactorTriplet:
     '''
     A factor triplet, FT, has four members:
@@ -497,6 +640,9 @@ class FactorTriplet:
      • The latest discrete component value, "FT.discrete".
 
      • The normalization value, "FT.normalizer".
+
+    Triplets are frozen, so "normalize" may share them. Their slots keep the few triplets built for every day of a
+    schedule small.
     '''
 
     # The three values of the triplet.
@@ -523,16 +669,23 @@ class FactorTriplet:
     def normalizer(self) -> decimal.Decimal:
         return self._norm
 
-    @typeguard.typechecked
     def __mul__(self, value: decimal.Decimal) -> 'FactorTriplet':
-        return FactorTriplet(_acc_lag=self._acc_val, _acc_val=self._acc_val * value, _ldc_val=value, _norm=self._norm)
+        return FactorTriplet(self._acc_val, self._acc_val * value, value, self._norm)
 
     def normalize(self, value: t.Optional['FactorTriplet'] = None) -> 'FactorTriplet':
-        if value:
-            return FactorTriplet(_acc_lag=value._acc_lag, _acc_val=value._acc_val, _ldc_val=value._ldc_val, _norm=self._norm)
+        # Triplets are immutable, so a triplet that is already normalized by the very same decimal can be returned as
+        # is. Equal decimals may have different exponents, which would change the ones of the divisions, hence "is".
+        if value and value._norm is self._norm:
+            return value
+
+        elif value:
+            return FactorTriplet(value._acc_lag, value._acc_val, value._ldc_val, self._norm)
+
+        elif self._norm is self._acc_lag:
+            return self
 
         else:
-            return FactorTriplet(_acc_lag=self._acc_lag, _acc_val=self._acc_val, _ldc_val=self._ldc_val, _norm=self._acc_lag)
+            return FactorTriplet(self._acc_lag, self._acc_val, self._ldc_val, self._acc_lag)
 
     def __str__(self) -> str:
         return f'({self.prev_value:.5f}/{self.normalizer:.5f}, {self.value:.5f}/{self.normalizer:.5f}, {self.discrete:.5f})'
@@ -613,7 +766,7 @@ class DctOverride:
 
     predates_first_amortization: bool
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Amortization:
     '''
     A entry of an amortization schedule.
@@ -634,13 +787,20 @@ class Amortization:
     previous payment date.
     '''
 
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Bare:
         '''
         A minimum amortization entry.
 
         This class is useful to specify prepayments. In this case, only the date and the amortization percentage are
         sufficient.
+
+        Bare entries are mutable, and compare all their fields, the DCT override included.
+
+        >>> a = Amortization.Bare(date=datetime.date(2022, 1, 5), value=decimal.Decimal('100'))
+        >>> b = Amortization.Bare(date=datetime.date(2022, 1, 5), value=decimal.Decimal('100.00'))
+        >>> a == b
+        True
         '''
 
         # Maximum value. Ver "http://stackoverflow.com/a/28082106".
@@ -670,7 +830,69 @@ class Amortization:
     # Extension field.
     dct_override: t.Optional[DctOverride] = None
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
+class _Registers:
+    '''
+    The registers of a payment schedule, updated period by period by "get_payments_table".
+
+    They were once a tree of "types.SimpleNamespace" objects, like "regs.principal.amortized.total". The flat record
+    takes one slot lookup per access, instead of one dictionary lookup per level.
+    '''
+
+    principal_ratio_current: decimal.Decimal = _0
+
+    principal_ratio_regular: decimal.Decimal = _0
+
+    principal_amortized_current: decimal.Decimal = _0
+
+    principal_amortized_total: decimal.Decimal = _0
+
+    interest_current: decimal.Decimal = _0
+
+    interest_accrued: decimal.Decimal = _0
+
+    interest_settled_current: decimal.Decimal = _0
+
+    interest_settled_total: decimal.Decimal = _0
+
+    interest_deferred: decimal.Decimal = _0
+
+    def __copy__(self) -> '_Registers':
+        # A snapshot is taken for every payment. The registers only hold decimals, which are immutable, so a plain
+        # constructor call is enough. It's much cheaper than the generic path of "copy.copy".
+        return _Registers(self.principal_ratio_current, self.principal_ratio_regular, self.principal_amortized_current,
+                          self.principal_amortized_total, self.interest_current, self.interest_accrued,
+                          self.interest_settled_current, self.interest_settled_total, self.interest_deferred)
+
+@dataclasses.dataclass(slots=True)
+class _DailyRegisters:
+    '''
+    The registers of a daily returns schedule, updated day by day by "get_daily_returns".
+
+    Same layout as "_Registers", plus the interest of the day. The amortization ratios are the adjusted and nominal ones.
+    '''
+
+    principal_ratio_adjusted: decimal.Decimal = _0
+
+    principal_ratio_nominal: decimal.Decimal = _0
+
+    principal_amortized_current: decimal.Decimal = _0
+
+    principal_amortized_total: decimal.Decimal = _0
+
+    interest_daily: decimal.Decimal = _0
+
+    interest_current: decimal.Decimal = _0
+
+    interest_accrued: decimal.Decimal = _0
+
+    interest_settled_current: decimal.Decimal = _0
+
+    interest_settled_total: decimal.Decimal = _0
+
+    interest_deferred: decimal.Decimal = _0
+
+@dataclasses.dataclass(slots=True)
 class Payment:
     '''
     An entry of a payment schedule.
@@ -720,9 +942,9 @@ class Payment:
 
     vf: decimal.Decimal = _1
 
-    _regs: types.SimpleNamespace = dataclasses.field(default_factory=types.SimpleNamespace)
+    _regs: _Registers = dataclasses.field(default_factory=_Registers)
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PriceAdjustedPayment(Payment):
     '''
     An entry of a payment schedule, with price level adjustment (IPCA or IGPM).
@@ -735,7 +957,7 @@ class PriceAdjustedPayment(Payment):
 
     cf: decimal.Decimal = _1
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DailyReturn:
     '''
     An entry of a daily returns table.
@@ -771,7 +993,7 @@ class DailyReturn:
 
     vf: decimal.Decimal = _1
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PriceAdjustedDailyReturn(DailyReturn):
     '''
     An entry of a daily returns table, with price level adjustment (IPCA or IGPM).
@@ -787,7 +1009,7 @@ class PriceAdjustedDailyReturn(DailyReturn):
 
     cf: decimal.Decimal = _1
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LatePayment(Payment):
     '''An entry of a payment schedule, with extra gain, penalty and fine values.'''
 
@@ -801,8 +1023,12 @@ class LatePayment(Payment):
 
     fine: decimal.Decimal = _0
 
+# Default late fee and fine rates of late payments, and their ratios. The rates are kept, to check against them.
+_FEE_RATE, _FEE_RATIO = LatePayment.FEE_RATE, LatePayment.FEE_RATE / _100
+_FINE_RATE, _FINE_RATIO = LatePayment.FINE_RATE, LatePayment.FINE_RATE / _100
+
 # FIXME: remove this class.
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LatePriceAdjustedPayment(PriceAdjustedPayment):
     '''An entry of a price adjusted payment schedule, with extra gain, penalty and fine values.'''
 
@@ -832,19 +1058,19 @@ class CalcDate:
 class BackendError(Exception):
     pass
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DailyIndex:
     date: datetime.date = datetime.date.min
 
     value: decimal.Decimal = _0
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MonthlyIndex:
     date: datetime.date = datetime.date.min
 
     value: decimal.Decimal = _0
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RangedIndex:
     begin_date: datetime.date = datetime.date.min
 
@@ -883,7 +1109,7 @@ class IndexStorageBackend:
 
         raise NotImplementedError()
 
-    @typeguard.typechecked
+    @_typechecked
     def calculate_cdi_factor(self, begin: datetime.date, end: datetime.date, percentage: int = 100) -> types.SimpleNamespace:
         '''
         Calculates the DI (CDI) factor for a given period.
@@ -926,27 +1152,32 @@ class IndexStorageBackend:
         '''
 
         if begin < end:
-            gen = self.get_cdi_indexes(begin, end - datetime.timedelta(days=1))  # Último dia, sempre excludente.
-            pct = decimal.Decimal(percentage) / decimal.Decimal(100)
-            idx = next(gen, None)
-            fac = _1
-            cnt = 0
+            mem = list(self.get_cdi_indexes(begin, end - datetime.timedelta(days=1)))  # Último dia, sempre excludente.
+            pos = [x for x in mem if x.value > 0]  # Non business days have null indexes, and don't count.
+            cnt = len(pos)
 
-            for x in _date_range(begin, end):
-                if idx and x == idx.date and idx.value > 0:
-                    fac = fac * (1 + pct * idx.value / decimal.Decimal(100))
+            # A CDI rate lasts for weeks, or months, so each distinct rate is turned into a daily factor only once. The
+            # full CDI is by far the most common case, and the multiplication by a unitary percentage can be skipped.
+            if percentage == 100:
+                fcs = {v: _1 + v / _100 for v in {x.value for x in pos}}
 
-                    _LOG.debug(idx)
+            else:
+                pct = _percentage_ratio(percentage)
+                fcs = {v: _1 + pct * v / _100 for v in {x.value for x in pos}}
 
-                    cnt = cnt + 1
+            fac = math.prod((fcs[x.value] for x in pos), start=_1)
 
-                    idx = next(gen, None)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                for x in pos:
+                    _LOG.debug(x)
 
-                elif idx and x == idx.date:
-                    idx = next(gen, None)
+            # There should be one index per calendar day. Only look for the missing ones if the count doesn't add up.
+            if len(mem) != (end - begin).days:
+                got = {x.date for x in mem}
 
-                else:
-                    _LOG.warning(f'CDI index for date {x} was not found')
+                for x in _date_range(begin, end):
+                    if x not in got:
+                        _LOG.warning(f'CDI index for date {x} was not found')
 
             return types.SimpleNamespace(value=fac, amount=cnt)
 
@@ -956,14 +1187,14 @@ class IndexStorageBackend:
         else:
             raise ValueError(f'end date {end} is not greater than begin date {begin}')
 
-    @typeguard.typechecked
+    @_typechecked
     def calculate_savings_factor(self, begin: datetime.date, end: datetime.date, percentage: int = 100) -> types.SimpleNamespace:
         '''Calculates the Brazilian Savings factor for a given period.'''
 
         if begin <= end:
             # Usa-se o 1º dia do mês seguinte como o aniversário dos dias 29, 30 e 31.
             ini = begin if begin.day <= 28 else (begin + _MONTH).replace(day=1)
-            pct = decimal.Decimal(percentage) / decimal.Decimal(100)
+            pct = _percentage_ratio(percentage)
             fac = _1
             mem = []
 
@@ -974,7 +1205,7 @@ class IndexStorageBackend:
             #
             for x in self.get_savings_indexes(ini, end):
                 if ini.day == x.begin_date.day:
-                    fac = fac * (_1 + pct * x.value / decimal.Decimal(100))
+                    fac = fac * (_1 + pct * x.value / _100)
 
                     mem.append(x)
 
@@ -987,7 +1218,7 @@ class IndexStorageBackend:
 
         raise ValueError(f'end date {end} is not greater than begin date {begin}')
 
-    @typeguard.typechecked
+    @_typechecked
     def calculate_ipca_factor(self, base: datetime.date, period: int, shift: _PL_SHIFT, ratio: decimal.Decimal = _1) -> types.SimpleNamespace:
         '''
         Calculates the IPCA correction factor.
@@ -1019,15 +1250,17 @@ class IndexStorageBackend:
         True
         '''
 
-        ini = base - _MONTH * t.get_args(_PL_SHIFT).index(shift)
-        end = base + _MONTH * (period - 1) - _MONTH * t.get_args(_PL_SHIFT).index(shift)
-        mem = list(self.get_ipca_indexes(ini, end))  # FIXME: try to avoid this conversion to list.
-        fac = _1
+        ini = base - _MONTH * _PL_SHIFT_MONTHS[shift]
+        end = base + _MONTH * (period - 1) - _MONTH * _PL_SHIFT_MONTHS[shift]
+        mem = list(self.get_ipca_indexes(ini, end))  # The indexes are also returned to the caller.
+        fac = math.prod((_1 + x.value / _100 for x in mem[:-1]), start=_1)
 
-        for i, x in enumerate(mem):
-            exp = _1 if i != len(mem) - 1 else ratio  # The ratio applies only to the last of a series of items.
+        # The ratio applies only to the last of a series of items.
+        if mem and ratio == _1:
+            fac = fac * (_1 + mem[-1].value / _100)
 
-            fac = fac * (_1 + x.value / decimal.Decimal(100)) ** exp
+        elif mem:
+            fac = fac * _fractional_power(_1 + mem[-1].value / _100, ratio)
 
         if not mem and period == 1:
             _LOG.warning(f'no IPCA indexes found for month {ini.year:04d}-{ini.month:02d} (base date is {base}, period is {period}, shift is {shift}, ratio is {ratio})')
@@ -1037,7 +1270,7 @@ class IndexStorageBackend:
 
         return types.SimpleNamespace(value=fac, mem=mem)
 
-    @typeguard.typechecked
+    @_typechecked
     def calculate_igpm_factor(self, base: datetime.date, period: int, shift: _PL_SHIFT, ratio: decimal.Decimal = _1) -> decimal.Decimal:
         '''Calculates the IGPM correction factor.'''
 
@@ -1052,9 +1285,12 @@ class InMemoryBackend(IndexStorageBackend):
     As this backend is mostly static, i.e., it does not update itself as new indexes are published, it isn't suited for
     production purposes.
 
-    It is fast since all data sets for CDI, IPCA, and Poupança are kept in primary memory. But isn't particularly
-    clever. For a given date range, no matter how small or large it is, the index fetching methods will always scan the
-    entire data sets.
+    It is fast since all data sets for CDI, IPCA, and Poupança are kept in primary memory. The fetching methods use a
+    binary search to skip to the first entries they need, and the CDI factor is reduced range by range of the registry,
+    rather than day by day.
+
+    With "memoize" set, the factors are also memoized by the instance, see "cache_clear". The default backend of
+    "VariableIndex" is shared by every schedule, so it doesn't memoize.
     '''
 
     _ignore_cdi = [
@@ -1145,142 +1381,157 @@ class InMemoryBackend(IndexStorageBackend):
         (datetime.date(2022, 11, 1), decimal.Decimal('0.41'))
     ]
 
-    # A repository of Poupança indexes.
+    # A repository of Poupança indexes. Repeated rates share the same decimal objects.
     _registry_savs = [
-        (datetime.date(2018, 1, 1),  [decimal.Decimal(x) for x in ['0.3994'] * 28]),                                  # NOQA
-        (datetime.date(2018, 2, 1),  [decimal.Decimal(x) for x in ['0.3994'] * 7 + ['0.3855'] * 21]),                 # NOQA
-        (datetime.date(2018, 3, 1),  [decimal.Decimal(x) for x in ['0.3855'] * 21 + ['0.3715'] * 7]),                 # NOQA
-        (datetime.date(2018, 4, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2018, 5, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2018, 6, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2018, 7, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2018, 8, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2018, 9, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2018, 10, 1), [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2018, 11, 1), [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2018, 12, 1), [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2019, 1, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2019, 2, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2019, 3, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2019, 4, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2019, 5, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2019, 6, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2019, 7, 1),  [decimal.Decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
-        (datetime.date(2019, 8, 1),  [decimal.Decimal(x) for x in ['0.3434'] * 28]),                                  # NOQA
-        (datetime.date(2019, 9, 1),  [decimal.Decimal(x) for x in ['0.3434'] * 18 + ['0.3153'] * 10]),                # NOQA
-        (datetime.date(2019, 10, 1), [decimal.Decimal(x) for x in ['0.3153'] * 28]),                                  # NOQA
-        (datetime.date(2019, 11, 1), [decimal.Decimal(x) for x in ['0.2871'] * 28]),                                  # NOQA
-        (datetime.date(2019, 12, 1), [decimal.Decimal(x) for x in ['0.2871'] * 11 + ['0.2588'] * 17]),                # NOQA
-        (datetime.date(2020, 1, 1),  [decimal.Decimal(x) for x in ['0.2588'] * 28]),                                  # NOQA
-        (datetime.date(2020, 2, 1),  [decimal.Decimal(x) for x in ['0.2588'] * 5 + ['0.2446'] * 23]),                 # NOQA
-        (datetime.date(2020, 3, 1),  [decimal.Decimal(x) for x in ['0.2446'] * 18 + ['0.2162'] * 10]),                # NOQA
-        (datetime.date(2020, 4, 1),  [decimal.Decimal(x) for x in ['0.2162'] * 28]),                                  # NOQA
-        (datetime.date(2020, 5, 1),  [decimal.Decimal(x) for x in ['0.2162'] * 6 + ['0.1733'] * 22]),                 # NOQA
-        (datetime.date(2020, 6, 1),  [decimal.Decimal(x) for x in ['0.1733'] * 17 + ['0.1303'] * 21]),                # NOQA
-        (datetime.date(2020, 7, 1),  [decimal.Decimal(x) for x in ['0.1303'] * 28]),                                  # NOQA
-        (datetime.date(2020, 8, 1),  [decimal.Decimal(x) for x in ['0.1303'] * 5 + ['0.1159'] * 23]),                 # NOQA
-        (datetime.date(2020, 9, 1),  [decimal.Decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
-        (datetime.date(2020, 10, 1), [decimal.Decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
-        (datetime.date(2020, 11, 1), [decimal.Decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
-        (datetime.date(2020, 12, 1), [decimal.Decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
-        (datetime.date(2021, 1, 1),  [decimal.Decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
-        (datetime.date(2021, 2, 1),  [decimal.Decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
-        (datetime.date(2021, 3, 1),  [decimal.Decimal(x) for x in ['0.1159'] * 17 + ['0.1590'] * 11]),                # NOQA
-        (datetime.date(2021, 4, 1),  [decimal.Decimal(x) for x in ['0.1590'] * 28]),                                  # NOQA
-        (datetime.date(2021, 5, 1),  [decimal.Decimal(x) for x in ['0.1590'] * 5 + ['0.2019'] * 23]),                 # NOQA
-        (datetime.date(2021, 6, 1),  [decimal.Decimal(x) for x in ['0.2019'] * 16 + ['0.2446'] * 12]),                # NOQA
-        (datetime.date(2021, 7, 1),  [decimal.Decimal(x) for x in ['0.2446'] * 28]),                                  # NOQA
-        (datetime.date(2021, 8, 1),  [decimal.Decimal(x) for x in ['0.2446'] * 4 + ['0.3012'] * 24]),                 # NOQA
-        (datetime.date(2021, 9, 1),  [decimal.Decimal(x) for x in ['0.3012'] * 22 + ['0.3575'] * 6]),                 # NOQA
-        (datetime.date(2021, 10, 1), [decimal.Decimal(x) for x in ['0.3575'] * 27 + ['0.4412']]),                     # NOQA
-        (datetime.date(2021, 11, 1), [decimal.Decimal(x) for x in ['0.4412'] * 15 + [
-                                                                   '0.4556', '0.4578', '0.4586', '0.4412', '0.4412',  # NOQA
-                                                                   '0.4412', '0.4570', '0.4583', '0.4607', '0.4620',
-                                                                   '0.4412', '0.4412', '0.4412']]),
-        (datetime.date(2021, 12, 1), [decimal.Decimal(x) for x in ['0.4902', '0.4739', '0.4572', '0.4626', '0.4890',
-                                                                   '0.5154', '0.5249', '0.5237', '0.5655', '0.5438',
-                                                                   '0.5471', '0.5732', '0.5992', '0.6029', '0.6042',
-                                                                   '0.5839', '0.5500', '0.5539', '0.5900', '0.6162',
-                                                                   '0.6201', '0.6147', '0.5910', '0.5691', '0.5739',
-                                                                   '0.6002', '0.6265', '0.6319']]),
-        (datetime.date(2022, 1, 1),  [decimal.Decimal(x) for x in ['0.5608', '0.5872', '0.6138', '0.6158', '0.6146',  # NOQA
-                                                                   '0.5908', '0.5660', '0.5677', '0.5946', '0.6215',
-                                                                   '0.6249', '0.6255', '0.6000', '0.5751', '0.5764',
-                                                                   '0.6036', '0.6310', '0.6324', '0.6340', '0.6107',
-                                                                   '0.5845', '0.5877', '0.6156', '0.6435', '0.6443',
-                                                                   '0.6371', '0.6119', '0.5480']]),
-        (datetime.date(2022, 2, 1),  [decimal.Decimal(x) for x in ['0.5000'] * 28]),                                  # NOQA
-        (datetime.date(2022, 3, 1),  [decimal.Decimal(x) for x in ['0.5976', '0.6304', '0.5997', '0.5673', '0.5779',  # NOQA
-                                                                   '0.6017', '0.6355', '0.6393', '0.6422', '0.6129',
-                                                                   '0.5855', '0.5938', '0.6274', '0.6513', '0.6559',
-                                                                   '0.6260', '0.6063', '0.5748', '0.5762', '0.6095',
-                                                                   '0.6329', '0.6021', '0.6046', '0.5839', '0.5512',
-                                                                   '0.5524', '0.5856', '0.6089']]),
-        (datetime.date(2022, 4, 1),  [decimal.Decimal(x) for x in ['0.5558', '0.5243', '0.5577', '0.5809', '0.5805',  # NOQA
-                                                                   '0.5822', '0.5842', '0.5614', '0.5325', '0.5661',
-                                                                   '0.5898', '0.5924', '0.5937', '0.5933', '0.5598',
-                                                                   '0.5598', '0.5938', '0.6277', '0.6286', '0.6308',
-                                                                   '0.6309', '0.6309', '0.5973', '0.6215', '0.6557',
-                                                                   '0.6546', '0.6576', '0.6617']]),
-        (datetime.date(2022, 5, 1),  [decimal.Decimal(x) for x in ['0.6671', '0.6919', '0.6914', '0.6947', '0.6646',  # NOQA
-                                                                   '0.6408', '0.6411', '0.6660', '0.7011', '0.7013',
-                                                                   '0.7033', '0.6672', '0.6414', '0.6425', '0.6674',
-                                                                   '0.7025', '0.6692', '0.6697', '0.6441', '0.6084',
-                                                                   '0.6067', '0.6418', '0.6667', '0.6724', '0.6719',
-                                                                   '0.6462', '0.6112', '0.6118']]),
-        (datetime.date(2022, 6, 1),  [decimal.Decimal(x) for x in ['0.6491', '0.6519', '0.6162', '0.5828', '0.6195',  # NOQA
-                                                                   '0.6462', '0.6491', '0.6509', '0.6520', '0.6260',
-                                                                   '0.5950', '0.6218', '0.6588', '0.6602', '0.6652',
-                                                                   '0.6643', '0.6643', '0.6279', '0.6648', '0.6917',
-                                                                   '0.6933', '0.6924', '0.6929', '0.6676', '0.6332',
-                                                                   '0.6701', '0.6972', '0.6972']]),
-        (datetime.date(2022, 7, 1),  [decimal.Decimal(x) for x in ['0.6639', '0.6643', '0.7013', '0.7284', '0.7281',  # NOQA
-                                                                   '0.7278', '0.7008', '0.6642', '0.6659', '0.7031',
-                                                                   '0.7303', '0.7307', '0.7324', '0.7058', '0.6696',
-                                                                   '0.6710', '0.7083', '0.7358', '0.7373', '0.7372',
-                                                                   '0.7100', '0.6724', '0.6730', '0.7105', '0.7381',
-                                                                   '0.7385', '0.7386', '0.7132']]),
-        (datetime.date(2022, 8, 1),  [decimal.Decimal(x) for x in ['0.7421', '0.7420', '0.7432', '0.7083', '0.6804',  # NOQA
-                                                                   '0.6810', '0.7088', '0.7088', '0.7075', '0.7075',
-                                                                   '0.6798', '0.6521', '0.6526', '0.6803', '0.7082',
-                                                                   '0.7084', '0.7086', '0.6793', '0.6524', '0.6524',
-                                                                   '0.6801', '0.7079', '0.7087', '0.7087', '0.6809',
-                                                                   '0.6527', '0.6430', '0.6808']]),
-        (datetime.date(2022, 9, 1),  [decimal.Decimal(x) for x in ['0.6814', '0.6432', '0.6152', '0.6430', '0.6809',  # NOQA
-                                                                   '0.6809', '0.6817', '0.7097', '0.6818', '0.6440',
-                                                                   '0.6819', '0.7097', '0.6819', '0.6830', '0.6835',
-                                                                   '0.6470', '0.6198', '0.6477', '0.6859', '0.6850',
-                                                                   '0.6845', '0.6824', '0.6512', '0.6142', '0.6520',
-                                                                   '0.6797', '0.6779', '0.6777']]),
-        (datetime.date(2022, 10, 1), [decimal.Decimal(x) for x in ['0.6501', '0.6778', '0.6778', '0.6789', '0.6796',
-                                                                   '0.6520', '0.6136', '0.6137', '0.6514', '0.6790',
-                                                                   '0.6811', '0.6798', '0.6798', '0.6516', '0.6515',
-                                                                   '0.6515', '0.6791', '0.6789', '0.6794', '0.6513',
-                                                                   '0.6143', '0.6147', '0.6524', '0.6801', '0.6794',
-                                                                   '0.6791', '0.6516', '0.6136']]),
-        (datetime.date(2022, 11, 1), [decimal.Decimal(x) for x in ['0.6515', '0.6515', '0.6792', '0.6519', '0.6139',
-                                                                   '0.6516', '0.6793', '0.6799', '0.6801', '0.6796'] + ['0.6448'] * 18])  # As 17 taxas finais são estimadas.
+        (datetime.date(2018, 1, 1),  [_decimal(x) for x in ['0.3994'] * 28]),                                  # NOQA
+        (datetime.date(2018, 2, 1),  [_decimal(x) for x in ['0.3994'] * 7 + ['0.3855'] * 21]),                 # NOQA
+        (datetime.date(2018, 3, 1),  [_decimal(x) for x in ['0.3855'] * 21 + ['0.3715'] * 7]),                 # NOQA
+        (datetime.date(2018, 4, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2018, 5, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2018, 6, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2018, 7, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2018, 8, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2018, 9, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2018, 10, 1), [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2018, 11, 1), [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2018, 12, 1), [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2019, 1, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2019, 2, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2019, 3, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2019, 4, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2019, 5, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2019, 6, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2019, 7, 1),  [_decimal(x) for x in ['0.3715'] * 28]),                                  # NOQA
+        (datetime.date(2019, 8, 1),  [_decimal(x) for x in ['0.3434'] * 28]),                                  # NOQA
+        (datetime.date(2019, 9, 1),  [_decimal(x) for x in ['0.3434'] * 18 + ['0.3153'] * 10]),                # NOQA
+        (datetime.date(2019, 10, 1), [_decimal(x) for x in ['0.3153'] * 28]),                                  # NOQA
+        (datetime.date(2019, 11, 1), [_decimal(x) for x in ['0.2871'] * 28]),                                  # NOQA
+        (datetime.date(2019, 12, 1), [_decimal(x) for x in ['0.2871'] * 11 + ['0.2588'] * 17]),                # NOQA
+        (datetime.date(2020, 1, 1),  [_decimal(x) for x in ['0.2588'] * 28]),                                  # NOQA
+        (datetime.date(2020, 2, 1),  [_decimal(x) for x in ['0.2588'] * 5 + ['0.2446'] * 23]),                 # NOQA
+        (datetime.date(2020, 3, 1),  [_decimal(x) for x in ['0.2446'] * 18 + ['0.2162'] * 10]),                # NOQA
+        (datetime.date(2020, 4, 1),  [_decimal(x) for x in ['0.2162'] * 28]),                                  # NOQA
+        (datetime.date(2020, 5, 1),  [_decimal(x) for x in ['0.2162'] * 6 + ['0.1733'] * 22]),                 # NOQA
+        (datetime.date(2020, 6, 1),  [_decimal(x) for x in ['0.1733'] * 17 + ['0.1303'] * 21]),                # NOQA
+        (datetime.date(2020, 7, 1),  [_decimal(x) for x in ['0.1303'] * 28]),                                  # NOQA
+        (datetime.date(2020, 8, 1),  [_decimal(x) for x in ['0.1303'] * 5 + ['0.1159'] * 23]),                 # NOQA
+        (datetime.date(2020, 9, 1),  [_decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
+        (datetime.date(2020, 10, 1), [_decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
+        (datetime.date(2020, 11, 1), [_decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
+        (datetime.date(2020, 12, 1), [_decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
+        (datetime.date(2021, 1, 1),  [_decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
+        (datetime.date(2021, 2, 1),  [_decimal(x) for x in ['0.1159'] * 28]),                                  # NOQA
+        (datetime.date(2021, 3, 1),  [_decimal(x) for x in ['0.1159'] * 17 + ['0.1590'] * 11]),                # NOQA
+        (datetime.date(2021, 4, 1),  [_decimal(x) for x in ['0.1590'] * 28]),                                  # NOQA
+        (datetime.date(2021, 5, 1),  [_decimal(x) for x in ['0.1590'] * 5 + ['0.2019'] * 23]),                 # NOQA
+        (datetime.date(2021, 6, 1),  [_decimal(x) for x in ['0.2019'] * 16 + ['0.2446'] * 12]),                # NOQA
+        (datetime.date(2021, 7, 1),  [_decimal(x) for x in ['0.2446'] * 28]),                                  # NOQA
+        (datetime.date(2021, 8, 1),  [_decimal(x) for x in ['0.2446'] * 4 + ['0.3012'] * 24]),                 # NOQA
+        (datetime.date(2021, 9, 1),  [_decimal(x) for x in ['0.3012'] * 22 + ['0.3575'] * 6]),                 # NOQA
+        (datetime.date(2021, 10, 1), [_decimal(x) for x in ['0.3575'] * 27 + ['0.4412']]),                     # NOQA
+        (datetime.date(2021, 11, 1), [_decimal(x) for x in ['0.4412'] * 15 + [
+                                                            '0.4556', '0.4578', '0.4586', '0.4412', '0.4412',  # NOQA
+                                                            '0.4412', '0.4570', '0.4583', '0.4607', '0.4620',
+                                                            '0.4412', '0.4412', '0.4412']]),
+        (datetime.date(2021, 12, 1), [_decimal(x) for x in ['0.4902', '0.4739', '0.4572', '0.4626', '0.4890',
+                                                            '0.5154', '0.5249', '0.5237', '0.5655', '0.5438',
+                                                            '0.5471', '0.5732', '0.5992', '0.6029', '0.6042',
+                                                            '0.5839', '0.5500', '0.5539', '0.5900', '0.6162',
+                                                            '0.6201', '0.6147', '0.5910', '0.5691', '0.5739',
+                                                            '0.6002', '0.6265', '0.6319']]),
+        (datetime.date(2022, 1, 1),  [_decimal(x) for x in ['0.5608', '0.5872', '0.6138', '0.6158', '0.6146',  # NOQA
+                                                            '0.5908', '0.5660', '0.5677', '0.5946', '0.6215',
+                                                            '0.6249', '0.6255', '0.6000', '0.5751', '0.5764',
+                                                            '0.6036', '0.6310', '0.6324', '0.6340', '0.6107',
+                                                            '0.5845', '0.5877', '0.6156', '0.6435', '0.6443',
+                                                            '0.6371', '0.6119', '0.5480']]),
+        (datetime.date(2022, 2, 1),  [_decimal(x) for x in ['0.5000'] * 28]),                                  # NOQA
+        (datetime.date(2022, 3, 1),  [_decimal(x) for x in ['0.5976', '0.6304', '0.5997', '0.5673', '0.5779',  # NOQA
+                                                            '0.6017', '0.6355', '0.6393', '0.6422', '0.6129',
+                                                            '0.5855', '0.5938', '0.6274', '0.6513', '0.6559',
+                                                            '0.6260', '0.6063', '0.5748', '0.5762', '0.6095',
+                                                            '0.6329', '0.6021', '0.6046', '0.5839', '0.5512',
+                                                            '0.5524', '0.5856', '0.6089']]),
+        (datetime.date(2022, 4, 1),  [_decimal(x) for x in ['0.5558', '0.5243', '0.5577', '0.5809', '0.5805',  # NOQA
+                                                            '0.5822', '0.5842', '0.5614', '0.5325', '0.5661',
+                                                            '0.5898', '0.5924', '0.5937', '0.5933', '0.5598',
+                                                            '0.5598', '0.5938', '0.6277', '0.6286', '0.6308',
+                                                            '0.6309', '0.6309', '0.5973', '0.6215', '0.6557',
+                                                            '0.6546', '0.6576', '0.6617']]),
+        (datetime.date(2022, 5, 1),  [_decimal(x) for x in ['0.6671', '0.6919', '0.6914', '0.6947', '0.6646',  # NOQA
+                                                            '0.6408', '0.6411', '0.6660', '0.7011', '0.7013',
+                                                            '0.7033', '0.6672', '0.6414', '0.6425', '0.6674',
+                                                            '0.7025', '0.6692', '0.6697', '0.6441', '0.6084',
+                                                            '0.6067', '0.6418', '0.6667', '0.6724', '0.6719',
+                                                            '0.6462', '0.6112', '0.6118']]),
+        (datetime.date(2022, 6, 1),  [_decimal(x) for x in ['0.6491', '0.6519', '0.6162', '0.5828', '0.6195',  # NOQA
+                                                            '0.6462', '0.6491', '0.6509', '0.6520', '0.6260',
+                                                            '0.5950', '0.6218', '0.6588', '0.6602', '0.6652',
+                                                            '0.6643', '0.6643', '0.6279', '0.6648', '0.6917',
+                                                            '0.6933', '0.6924', '0.6929', '0.6676', '0.6332',
+                                                            '0.6701', '0.6972', '0.6972']]),
+        (datetime.date(2022, 7, 1),  [_decimal(x) for x in ['0.6639', '0.6643', '0.7013', '0.7284', '0.7281',  # NOQA
+                                                            '0.7278', '0.7008', '0.6642', '0.6659', '0.7031',
+                                                            '0.7303', '0.7307', '0.7324', '0.7058', '0.6696',
+                                                            '0.6710', '0.7083', '0.7358', '0.7373', '0.7372',
+                                                            '0.7100', '0.6724', '0.6730', '0.7105', '0.7381',
+                                                            '0.7385', '0.7386', '0.7132']]),
+        (datetime.date(2022, 8, 1),  [_decimal(x) for x in ['0.7421', '0.7420', '0.7432', '0.7083', '0.6804',  # NOQA
+                                                            '0.6810', '0.7088', '0.7088', '0.7075', '0.7075',
+                                                            '0.6798', '0.6521', '0.6526', '0.6803', '0.7082',
+                                                            '0.7084', '0.7086', '0.6793', '0.6524', '0.6524',
+                                                            '0.6801', '0.7079', '0.7087', '0.7087', '0.6809',
+                                                            '0.6527', '0.6430', '0.6808']]),
+        (datetime.date(2022, 9, 1),  [_decimal(x) for x in ['0.6814', '0.6432', '0.6152', '0.6430', '0.6809',  # NOQA
+                                                            '0.6809', '0.6817', '0.7097', '0.6818', '0.6440',
+                                                            '0.6819', '0.7097', '0.6819', '0.6830', '0.6835',
+                                                            '0.6470', '0.6198', '0.6477', '0.6859', '0.6850',
+                                                            '0.6845', '0.6824', '0.6512', '0.6142', '0.6520',
+                                                            '0.6797', '0.6779', '0.6777']]),
+        (datetime.date(2022, 10, 1), [_decimal(x) for x in ['0.6501', '0.6778', '0.6778', '0.6789', '0.6796',
+                                                            '0.6520', '0.6136', '0.6137', '0.6514', '0.6790',
+                                                            '0.6811', '0.6798', '0.6798', '0.6516', '0.6515',
+                                                            '0.6515', '0.6791', '0.6789', '0.6794', '0.6513',
+                                                            '0.6143', '0.6147', '0.6524', '0.6801', '0.6794',
+                                                            '0.6791', '0.6516', '0.6136']]),
+        (datetime.date(2022, 11, 1), [_decimal(x) for x in ['0.6515', '0.6515', '0.6792', '0.6519', '0.6139',
+                                                            '0.6516', '0.6793', '0.6799', '0.6801', '0.6796'] + ['0.6448'] * 18])  # As 17 taxas finais são estimadas.
     ]
 
+    # Walks the ranges of the CDI registry between two dates, both inclusive, yielding the first and last ordinals of
+    # each range within the period, its rate, and whether each of its days is a business day.
+    #
+    # The holidays are read from "_ignore_cdi" on every walk, so a list set on a subclass, or on an instance, is used.
+    #
+    def _walk_cdi_registry(self, begin: datetime.date, end: datetime.date) -> t.Generator[t.Tuple[int, int, decimal.Decimal, t.List[bool]], None, None]:
+        ign = {x.toordinal() for x in self._ignore_cdi}
+
+        # The registry is sorted, so a binary search skips all ranges that end before the begin date.
+        pos = bisect.bisect_left(self._registry_cdi, begin, key=operator.itemgetter(1))
+
+        for dref, done, value in itertools.islice(self._registry_cdi, pos, None):
+            if dref > end:
+                break
+
+            lo = max(dref, begin).toordinal()
+            hi = min(done, end).toordinal()
+
+            # Ordinal one is a Monday, so "(x + 6) % 7" is the weekday of ordinal "x".
+            yield lo, hi, value, [(x + 6) % 7 < 5 and x not in ign for x in range(lo, hi + 1)]
+
     # This method does not need to compensate for missing indexes (it does not rely on the BACEN API). It also does not
     # project future indexes, as this is unsafe and should be reserved for specific backend implementations. One could
     # create a "CdiIndexProjectingBackend" and plug it in the "vir" parameter of Fincore calls if index projection is
     # desired.
     #
-    @typeguard.typechecked
+    # The index generators of this backend are not type checked, as Typeguard would also check every index they yield.
+    # Their arguments are checked by the factor methods of the base class, which call them.
+    #
     def get_cdi_indexes(self, begin: datetime.date, end: datetime.date, **_: dict[str, t.Any]) -> t.Generator[DailyIndex, None, None]:
         if self._registry_cdi and self._registry_cdi[0] and self._registry_cdi[0][0] <= begin <= end:
-            dref = self._registry_cdi[0][0]
-
-            for dref, done, value in self._registry_cdi:
-                while dref <= done:
-                    if begin <= dref <= end and dref.weekday() < 5 and dref not in self._ignore_cdi:
-                        yield DailyIndex(date=dref, value=value)
-
-                    elif begin <= dref <= end:
-                        yield DailyIndex(date=dref, value=_0)
-
-                    dref += datetime.timedelta(days=1)
+            for lo, _, value, bus in self._walk_cdi_registry(begin, end):
+                for x, y in enumerate(bus, lo):
+                    yield DailyIndex(date=datetime.date.fromordinal(x), value=value if y else _0)
 
         elif self._registry_cdi and self._registry_cdi[0] and begin >= self._registry_cdi[0][0]:
             raise ValueError('the initial date must be greater than, or equal to, the end date')
@@ -1298,14 +1549,16 @@ class InMemoryBackend(IndexStorageBackend):
     # I do not think that Fincore data structures, like MonthlyIndex, should expose these flaws internally. It should
     # be designed to best suit its use by this module.
     #
-    @typeguard.typechecked
     def get_ipca_indexes(self, begin: datetime.date, end: datetime.date) -> t.Generator[MonthlyIndex, None, None]:
         if self._registry_ipca and self._registry_ipca[0]:
-            month = self._registry_ipca[0][0]
+            # The registry is sorted, so the indexes between the begin and end dates are a slice of it.
+            lo = bisect.bisect_left(self._registry_ipca, begin, key=operator.itemgetter(0))
+            hi = bisect.bisect_right(self._registry_ipca, end, key=operator.itemgetter(0))
+
+            for month, value in itertools.islice(self._registry_ipca, lo, hi):
+                yield MonthlyIndex(date=month, value=value)
 
-            for month, value in self._registry_ipca:
-                if begin <= month <= end:
-                    yield MonthlyIndex(date=month, value=value)
+            month = self._registry_ipca[-1][0]
 
             while month < end:
                 month += _MONTH
@@ -1318,22 +1571,136 @@ class InMemoryBackend(IndexStorageBackend):
     # FIXME: this method simulates the behaviour of the BACEN API. But the API is pretty dumb. It returns redundant data,
     # like "2018-01-01" to represent January of 2018.
     #
-    @typeguard.typechecked
     def get_savings_indexes(self, begin: datetime.date, end: datetime.date) -> t.Generator[RangedIndex, None, None]:
         if self._registry_savs and self._registry_savs[0]:
-            for d0, values in self._registry_savs:
-                i, d = 0, d0
+            ini = begin.toordinal()
+            fin = end.toordinal()
+
+            # The registry is sorted, and each month holds 28 indexes, so a binary search skips all months whose last
+            # index comes before the begin date.
+            pos = bisect.bisect_left(self._registry_savs, ini - 27, key=lambda x: x[0].toordinal())
+
+            for d0, values in itertools.islice(self._registry_savs, pos, None):
+                if d0 > end:
+                    break
 
-                while i < 28:
-                    if begin <= d <= end:
-                        yield RangedIndex(begin_date=d, end_date=d + _MONTH, value=values[i])
+                off = d0.toordinal()
 
-                    d += datetime.timedelta(days=1)
-                    i += 1
+                for i in range(max(ini - off, 0), min(fin - off + 1, 28)):
+                    d = datetime.date.fromordinal(off + i)
+
+                    yield RangedIndex(begin_date=d, end_date=d + _MONTH, value=values[i])
 
         else:
             raise ValueError('this backend has no savings indexes')
 
+    # The data sets of this backend are static, so its factors can be memoized. Overlapping schedules, and repeated runs
+    # of a schedule, ask for the same factors over and over.
+    #
+    # Each instance created with "memoize" set keeps one small memo per kind of factor, keyed on the arguments of the
+    # call. The memos are created by "__init__", and dropped by "cache_clear", which must be called after changing the
+    # registries of an instance. Without "memoize" the memos stay empty.
+    # Each memo stops growing at 4096 factors. The memoized values are tuples. Every caller gets a fresh namespace, which
+    # it is free to change.
+    #
+    # Only the factors computed without warnings are memoized, i.e., the ones with indexes, so that a missing index is
+    # warned about on every call, as with the base class. With debug logging on, which logs every index, the memos are
+    # not used at all.
+    #
+    # The public methods below are called for every period, or every day, of a schedule, so they are not type checked.
+    # Instead, they check the exact types of their arguments, which is cheap, before looking at the memo. Arguments of
+    # any other type, say a float percentage, which would hit the entry of an equal integer, skip the memo and go to the
+    # base class, whose methods are type checked.
+    #
+    def __init__(self, memoize: bool = False) -> None:
+        super().__init__()
+
+        self._memoize = memoize
+        self._memo_cdi: t.Dict[t.Tuple[datetime.date, datetime.date, int], t.Tuple[decimal.Decimal, int]] = {}
+        self._memo_savs: t.Dict[t.Tuple[datetime.date, datetime.date, int], t.Tuple[decimal.Decimal, int]] = {}
+        self._memo_ipca: t.Dict[t.Tuple[t.Any, ...], t.Tuple[decimal.Decimal, t.Tuple[t.Tuple[datetime.date, decimal.Decimal], ...]]] = {}
+
+    def cache_clear(self) -> None:
+        '''Drops the memoized factors of the backend.'''
+
+        self._memo_cdi.clear()
+        self._memo_savs.clear()
+        self._memo_ipca.clear()
+
+    # Calculates the CDI factor straight from the registry ranges, without building a daily index for each day. Each
+    # range has a single rate, so only its business days have to be counted.
+    #
+    # Returns None whenever the generic calculation of the base class must be used instead: a subclass with its own
+    # CDI indexes, debug logging (which prints every index), a period that is not fully covered by the registry (which
+    # warns about missing indexes), or an invalid period (which raises an error).
+    #
+    # The product is taken in the same order, day by day, so the factor is exactly the one of the generic calculation.
+    #
+    def _reduce_cdi_registry(self, begin: datetime.date, end: datetime.date, percentage: int) -> t.Optional[t.Tuple[decimal.Decimal, int]]:
+        if type(self).get_cdi_indexes is not InMemoryBackend.get_cdi_indexes or _LOG.isEnabledFor(logging.DEBUG):
+            return None
+
+        elif not self._registry_cdi or not self._registry_cdi[0] or not self._registry_cdi[0][0] <= begin < end:
+            return None
+
+        pct = _percentage_ratio(percentage)
+        fac = _1
+        cnt = 0
+        nxt = begin.toordinal()
+
+        # Último dia, sempre excludente.
+        for lo, hi, value, bus in self._walk_cdi_registry(begin, end - datetime.timedelta(days=1)):
+            if lo != nxt:
+                return None
+
+            elif (num := sum(bus)) and value > 0:
+                val = _1 + value / _100 if percentage == 100 else _1 + pct * value / _100
+                fac = math.prod(itertools.repeat(val, num), start=fac)
+                cnt += num
+
+            nxt = hi + 1
+
+        return (fac, cnt) if nxt == end.toordinal() else None
+
+    def calculate_cdi_factor(self, begin: datetime.date, end: datetime.date, percentage: int = 100) -> types.SimpleNamespace:
+        if _LOG.isEnabledFor(logging.DEBUG) or type(begin) is not datetime.date or type(end) is not datetime.date or type(percentage) is not int:
+            return IndexStorageBackend.calculate_cdi_factor(self, begin, end, percentage)
+
+        elif (tup := self._memo_cdi.get((begin, end, percentage))) is None:
+            if (tup := self._reduce_cdi_registry(begin, end, percentage)) is None:
+                return IndexStorageBackend.calculate_cdi_factor(self, begin, end, percentage)
+
+            elif self._memoize and len(self._memo_cdi) < 4096:
+                self._memo_cdi[(begin, end, percentage)] = tup
+
+        return types.SimpleNamespace(value=tup[0], amount=tup[1])
+
+    def calculate_savings_factor(self, begin: datetime.date, end: datetime.date, percentage: int = 100) -> types.SimpleNamespace:
+        if _LOG.isEnabledFor(logging.DEBUG) or type(begin) is not datetime.date or type(end) is not datetime.date or type(percentage) is not int:
+            return IndexStorageBackend.calculate_savings_factor(self, begin, end, percentage)
+
+        elif (tup := self._memo_savs.get((begin, end, percentage))) is None:
+            if (out := IndexStorageBackend.calculate_savings_factor(self, begin, end, percentage)).amount and self._memoize and len(self._memo_savs) < 4096:
+                self._memo_savs[(begin, end, percentage)] = (out.value, out.amount)
+
+            return out
+
+        return types.SimpleNamespace(value=tup[0], amount=tup[1])
+
+    # Equal ratios may have different exponents, which carry over to the factor, so the key holds the digits of the ratio.
+    #
+    def calculate_ipca_factor(self, base: datetime.date, period: int, shift: _PL_SHIFT, ratio: decimal.Decimal = _1) -> types.SimpleNamespace:
+        if type(base) is not datetime.date or type(period) is not int or type(shift) is not str or shift not in _PL_SHIFT_MONTHS or type(ratio) is not decimal.Decimal:
+            return IndexStorageBackend.calculate_ipca_factor(self, base, period, shift, ratio)
+
+        elif (tup := self._memo_ipca.get(key := (base, period, shift, ratio.as_tuple()))) is None:
+            if (out := IndexStorageBackend.calculate_ipca_factor(self, base, period, shift, ratio)).mem and self._memoize and len(self._memo_ipca) < 4096:
+                self._memo_ipca[key] = (out.value, tuple((x.date, x.value) for x in out.mem))
+
+            return out
+
+        return types.SimpleNamespace(value=tup[0], mem=[MonthlyIndex(date=x, value=y) for x, y in tup[1]])
+
 @dataclasses.dataclass(frozen=True, eq=True)
 class VariableIndex:
     code: t.Union[_VR_INDEX, _PL_INDEX] = 'CDI'
@@ -1344,7 +1711,7 @@ class VariableIndex:
 # }}}
 
 # Public API. Payments table. {{{
-@typeguard.typechecked
+@_typechecked
 def get_payments_table(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -1414,72 +1781,74 @@ def get_payments_table(
     more details about these data structures.
     '''
 
+    # Multiplying by the neutral factor changes neither the value, nor the exponent, of a decimal. So the balance of a loan
+    # without price level correction skips the multiplications.
+    #
     def calc_balance(correction_factor: decimal.Decimal = _1) -> decimal.Decimal:
-        val = principal * correction_factor + regs.interest.accrued - regs.principal.amortized.total * correction_factor - regs.interest.settled.total
+        if correction_factor is _1:
+            val = principal + regs.interest_accrued - regs.principal_amortized_total - regs.interest_settled_total
+
+        else:
+            val = principal * correction_factor + regs.interest_accrued - regs.principal_amortized_total * correction_factor - regs.interest_settled_total
 
         return t.cast(decimal.Decimal, val)
 
-    # First principal generator.
+    # First principal tracker.
     #
-    #  • "principal.amortization_ratio.current", is the current period's amortization percentage.
-    #  • "principal.amortized.current", is the principal amortized in the current period.
-    #  • "principal.amortized.total", is the total principal amortized (current period plus past periods).
+    #  • "principal_ratio_current", is the current period's amortization percentage.
+    #  • "principal_amortized_current", is the principal amortized in the current period.
+    #  • "principal_amortized_total", is the total principal amortized (current period plus past periods).
     #
-    def track_principal_1() -> t.Generator[None, decimal.Decimal | None, None]:
-        while True:
-            ratio = yield
-
-            # If the current amortization percentage plus the accumulated percentage exceeds 100%, an adjustment must be made.
-            if regs.principal.amortization_ratio.current + ratio > _1:
-                ratio = _1 - regs.principal.amortization_ratio.current
+    # The trackers were once coroutines, fed with "send". They hold no state of their own, only update the registers, so
+    # plain calls are enough, and cheaper.
+    #
+    def track_principal_1(ratio: decimal.Decimal) -> None:
+        # If the current amortization percentage plus the accumulated percentage exceeds 100%, an adjustment must be made.
+        if regs.principal_ratio_current + ratio > _1:
+            ratio = _1 - regs.principal_ratio_current
 
-            if ratio:
-                regs.principal.amortization_ratio.current += ratio
-                regs.principal.amortized = types.SimpleNamespace(current=ratio * principal, total=regs.principal.amortization_ratio.current * principal)
+        if ratio:
+            regs.principal_ratio_current += ratio
+            regs.principal_amortized_current = ratio * principal
+            regs.principal_amortized_total = regs.principal_ratio_current * principal
 
-            else:
-                regs.principal.amortized = types.SimpleNamespace(current=_0, total=regs.principal.amortized.total)
+        else:
+            regs.principal_amortized_current = _0
 
-    # Second principal generator.
+    # Second principal tracker.
     #
-    #  • "principal.amortization_ratio.regular", is the regular amortization percentage accumulated (current period plus past periods)
+    #  • "principal_ratio_regular", is the regular amortization percentage accumulated (current period plus past periods)
     #
-    def track_principal_2() -> t.Generator[None, decimal.Decimal | None, None]:
-        while True:
-            ratio = yield
+    def track_principal_2(ratio: decimal.Decimal) -> None:
+        # If the regular amortization percentage plus the accumulated percentage exceeds 100%, an adjustment must be made.
+        if regs.principal_ratio_regular + ratio > _1:
+            ratio = _1 - regs.principal_ratio_regular
 
-            # If the regular amortization percentage plus the accumulated percentage exceeds 100%, an adjustment must be made.
-            if regs.principal.amortization_ratio.regular + ratio > _1:
-                ratio = _1 - regs.principal.amortization_ratio.regular
+        if ratio:
+            regs.principal_ratio_regular += ratio
 
-            if ratio:
-                regs.principal.amortization_ratio.regular += ratio
-
-    # Interest generator.
+    # Interest tracker.
     #
-    #   • "interest.current" is the interest accrued (produced) in the current period.
-    #   • "interest.accrued" is the total interest accrued since the zero day of the payment schedule.
-    #   • "interest.deferred" is the total deferred interest from past periods.
+    #   • "interest_current" is the interest accrued (produced) in the current period.
+    #   • "interest_accrued" is the total interest accrued since the zero day of the payment schedule.
+    #   • "interest_deferred" is the total deferred interest from past periods.
     #
-    def track_interest_1() -> t.Generator[None, decimal.Decimal | None, None]:
-        while True:
-            regs.interest.current = yield
-            regs.interest.accrued += regs.interest.current
-            regs.interest.deferred = regs.interest.accrued - (regs.interest.current + regs.interest.settled.total)
+    def track_interest_1(value: decimal.Decimal) -> None:
+        regs.interest_current = value
+        regs.interest_accrued += regs.interest_current
+        regs.interest_deferred = regs.interest_accrued - (regs.interest_current + regs.interest_settled_total)
 
-    # Interest settled generator between borrower and creditor.
+    # Interest settled tracker, between borrower and creditor.
     #
-    #   • "interest.settled.current" is the interest settled in the current period.
-    #   • "interest.settled.total" is the total interest settled since the zero day of the payment schedule.
+    #   • "interest_settled_current" is the interest settled in the current period.
+    #   • "interest_settled_total" is the total interest settled since the zero day of the payment schedule.
     #
-    def track_interest_2() -> t.Generator[None, decimal.Decimal | None, None]:
-        while True:
-            regs.interest.settled = types.SimpleNamespace(current=(yield), total=regs.interest.settled.total)
-            regs.interest.settled.total += regs.interest.settled.current
+    def track_interest_2(value: decimal.Decimal) -> None:
+        regs.interest_settled_current = value
+        regs.interest_settled_total += regs.interest_settled_current
 
     # A. Validation and preparation.
-    gens = types.SimpleNamespace()
-    regs = types.SimpleNamespace()
+    regs = _Registers()
     aux = _0
 
     if principal == _0:
@@ -1497,11 +1866,21 @@ def get_payments_table(
     elif vir and vir.code == 'CDI' and capitalisation != '252':
         raise ValueError('CDI should use the 252 working days capitalisation')
 
+    elif vir and (vir.code, capitalisation) not in _VIR_CAPITALISATIONS:
+        raise NotImplementedError(f'Combination of variable interest rate {vir} and capitalisation {capitalisation} unsupported')
+
+    elif not vir and capitalisation not in _FIXED_CAPITALISATIONS:
+        raise NotImplementedError(f'Unsupported capitalisation {capitalisation} for fixed interest rate')
+
+    # Whether a price level adjustment in the schedule is an error. The index doesn't change from one amortization to
+    # the next, so it's checked only once.
+    bad = bool(vir and vir.code not in _PL_INDEX_CODES)
+
     for i, x in enumerate(amortizations):
         if type(x) is Amortization:
             aux += x.amortization_ratio
 
-        if vir and vir.code not in t.get_args(_PL_INDEX) and type(x) is Amortization and x.price_level_adjustment:
+        if bad and type(x) is Amortization and x.price_level_adjustment:
             raise TypeError(f"amortization {i} has price level adjustment, but either a variable index wasn't provided or it isn't IPCA nor IGPM")
 
         elif aux > _1 and not math.isclose(aux, _1):
@@ -1513,40 +1892,35 @@ def get_payments_table(
     if calc_date is None:
         calc_date = CalcDate(value=amortizations[-1].date, runaway=False)
 
-    # Registers.
-    regs.principal = types.SimpleNamespace(amortization_ratio=types.SimpleNamespace(current=_0, regular=_0), amortized=types.SimpleNamespace(current=_0, total=_0))
-    regs.interest = types.SimpleNamespace(current=_0, accrued=_0, settled=types.SimpleNamespace(current=_0, total=_0), deferred=_0)
+    # Whether the payments undergo price level adjustment. Checked a few times for every payment.
+    ipca = bool(vir and vir.code == 'IPCA')
 
-    # Control, create generators.
-    gens.interest_tracker_1 = track_interest_1()
-    gens.interest_tracker_2 = track_interest_2()
-    gens.principal_tracker_1 = track_principal_1()
-    gens.principal_tracker_2 = track_principal_2()
-
-    # Control, start generators.
-    gens.principal_tracker_1.send(None)
-    gens.principal_tracker_2.send(None)
-    gens.interest_tracker_1.send(None)
-    gens.interest_tracker_2.send(None)
+    # Neutral variable factor, for periods without a variable index. Never changed, so it's shared by all periods.
+    f_0 = types.SimpleNamespace(amount=_0, value=_1)
 
     # B. Execution.
     for num, (ent0, ent1) in enumerate(itertools.pairwise(amortizations), 1):
-        f_v = types.SimpleNamespace(amount=_0, value=_1)
+        act = ent0.date < calc_date.value or ent1.date <= calc_date.value  # The period is not past the calculation date.
+        f_v = f_0
         due = min(calc_date.value, ent1.date)
         f_s = f_c = _1
 
+        # Amortizations are ordered. Once a period is past the calculation date, so are the following ones.
+        if not act and not calc_date.runaway:
+            break
+
         # Phase B.0, FZA, or Phase Zille-Anna.
         #
         #  • Calculates FS (spread factor) for fixed rate index; and both FS and FC for price level index.
         #
         #  • Calculates FS for post fixed index (CDI, Brazilian Savings etc).
         #
-        if ent0.date < calc_date.value or ent1.date <= calc_date.value:
+        if act:
             if not vir and capitalisation == '360':  # Bullet.
-                f_s = calculate_interest_factor(apy, decimal.Decimal((due - ent0.date).days) / decimal.Decimal(360))
+                f_s = calculate_interest_factor(apy, _fraction((due - ent0.date).days, 360))
 
             elif not vir and capitalisation == '365':  # Bullet in legacy mode.
-                f_s = calculate_interest_factor(apy, decimal.Decimal((due - ent0.date).days) / decimal.Decimal(365))
+                f_s = calculate_interest_factor(apy, _fraction((due - ent0.date).days, 365))
 
             elif not vir and capitalisation == '30/360':  # American Amortization, Price, Custom.
                 dcp = (due - ent0.date).days
@@ -1570,18 +1944,18 @@ def get_payments_table(
                     if ent0.dct_override.predates_first_amortization:
                         dct = _diff_surrounding_dates(ent0.dct_override.date_from, 24)
 
-                f_s = calculate_interest_factor(apy, decimal.Decimal(dcp) / (12 * decimal.Decimal(dct)))
+                f_s = calculate_interest_factor(apy, _fraction(dcp, 12 * dct))
 
             elif vir and vir.code == 'CDI' and capitalisation == '252':  # Bullet, American Amortization, Custom.
                 f_v = vir.backend.calculate_cdi_factor(ent0.date, due, vir.percentage)  # Variable rate (or factor), FV.
-                f_s = calculate_interest_factor(apy, decimal.Decimal(f_v.amount) / decimal.Decimal(252)) * f_v.value
+                f_s = calculate_interest_factor(apy, _fraction(f_v.amount, 252)) * f_v.value
 
             elif vir and vir.code == 'Poupança' and capitalisation == '360':  # Brazilian Savings only supported in Bullet.
                 f_v = vir.backend.calculate_savings_factor(ent0.date, due, vir.percentage)  # Variable rate (or factor), FV.
-                f_s = calculate_interest_factor(apy, decimal.Decimal((due - ent0.date).days) / decimal.Decimal(360)) * f_v.value
+                f_s = calculate_interest_factor(apy, _fraction((due - ent0.date).days, 360)) * f_v.value
 
             elif vir and vir.code == 'IPCA' and capitalisation == '360':  # Bullet.
-                f_s = calculate_interest_factor(apy, decimal.Decimal((due - ent0.date).days) / decimal.Decimal(360))
+                f_s = calculate_interest_factor(apy, _fraction((due - ent0.date).days, 360))
 
                 if type(ent1) is Amortization and ent1.price_level_adjustment:
                     kwa: t.Dict[str, t.Any] = {}
@@ -1626,7 +2000,7 @@ def get_payments_table(
                     if ent0.dct_override.predates_first_amortization:
                         dct = _diff_surrounding_dates(ent0.dct_override.date_from, 24)
 
-                f_s = calculate_interest_factor(apy, decimal.Decimal(dcp) / (12 * decimal.Decimal(dct)))
+                f_s = calculate_interest_factor(apy, _fraction(dcp, 12 * dct))
 
                 if type(ent1) is Amortization and ent1.price_level_adjustment or type(ent1) is Amortization.Bare:
                     if type(ent1) is Amortization:
@@ -1636,7 +2010,7 @@ def get_payments_table(
                         kwc['base'] = pla.base_date
                         kwc['period'] = pla.period
                         kwc['shift'] = pla.shift
-                        kwc['ratio'] = decimal.Decimal(dcp) / decimal.Decimal(dct)
+                        kwc['ratio'] = _fraction(dcp, dct)
 
                         f_c = max(vir.backend.calculate_ipca_factor(**kwc).value, _1)  # Lock the price level factor.
 
@@ -1646,16 +2020,10 @@ def get_payments_table(
                         kwd['base'] = amortizations[0].date.replace(day=1)
                         kwd['period'] = _delta_months(ent1.date, amortizations[0].date)
                         kwd['shift'] = 'M-1'  # FIXME.
-                        kwd['ratio'] = decimal.Decimal(dcp) / decimal.Decimal(dct)
+                        kwd['ratio'] = _fraction(dcp, dct)
 
                         f_c = max(vir.backend.calculate_ipca_factor(**kwd).value, _1)  # Lock the price level factor.
 
-            elif vir:
-                raise NotImplementedError(f'Combination of variable interest rate {vir} and capitalisation {capitalisation} unsupported')
-
-            else:
-                raise NotImplementedError(f'Unsupported capitalisation {capitalisation} for fixed interest rate')
-
         # Phase B.1, FRO, or Phase Rafa One.
         #
         # Using the factors calculated in the previous phase, calculates and registers the variations in principal, interest,
@@ -1674,187 +2042,187 @@ def get_payments_table(
         # Where ACUR is the remaining amortization percentage of the payment flow, including extraordinary amortizations
         # (advancements), and AREG is the remaining regular amortization percentage of the payment flow.
         #
-        if ent0.date < calc_date.value or ent1.date <= calc_date.value or calc_date.runaway:
-            # Register the interest accrued in the period.
-            gens.interest_tracker_1.send(calc_balance(f_c) * (f_s - _1))
 
-            # Case of a regular amortization.
-            if type(ent1) is Amortization:
-                adj = (_1 - regs.principal.amortization_ratio.current) / (_1 - regs.principal.amortization_ratio.regular)  # [ADJUSTMENT-FACTOR].
+        # Register the interest accrued in the period.
+        track_interest_1(calc_balance(f_c) * (f_s - _1))
 
-                # Register the amortization percentage.
-                gens.principal_tracker_1.send(ent1.amortization_ratio * adj)
+        # Case of a regular amortization.
+        if type(ent1) is Amortization:
+            adj = (_1 - regs.principal_ratio_current) / (_1 - regs.principal_ratio_regular)  # [ADJUSTMENT-FACTOR].
 
-                # Register the non adjusted amortization percentage.
-                gens.principal_tracker_2.send(ent1.amortization_ratio)
+            # Register the amortization percentage.
+            track_principal_1(ent1.amortization_ratio * adj)
 
-                # Register the interest to be settled in the period.
-                if ent1.amortizes_interest:
-                    gens.interest_tracker_2.send(regs.interest.current + regs.principal.amortization_ratio.current * regs.interest.deferred)
+            # Register the non adjusted amortization percentage.
+            track_principal_2(ent1.amortization_ratio)
 
-            # Case of an advancement (extraordinary amortization).
-            #
-            # Remember that an advance presents only a gross value to be paid on a certain date. This gross value will be
-            # factored into various components of the debt, in an ordered manner. The first component of the debt to be
-            # amortized is the interest (spread). After payment of the interest, what remains must be deducted from the
-            # monetary correction. Finally, subtract the remaining value of the principal. In the block of code below,
-            #
-            #  • "val1" is the price level corrected interest to be paid;
-            #
-            #  • "val2" is the principal to be amortized.
-            #
-            # Observe that the order of calculation of these variables corresponds to the order of factorisation of the
-            # gross value of the advance.
-            #
-            else:
-                ent1 = t.cast(Amortization.Bare, ent1)  # Mypy can't infer the type of the "ent1" variable here.
-                val0 = min(ent1.value, calc_balance(f_c))
-                val1 = min(val0, regs.interest.accrued - regs.interest.settled.total)
-                val2 = val0 - val1
+            # Register the interest to be settled in the period.
+            if ent1.amortizes_interest:
+                track_interest_2(regs.interest_current + regs.principal_ratio_current * regs.interest_deferred)
+
+        # Case of an advancement (extraordinary amortization).
+        #
+        # Remember that an advance presents only a gross value to be paid on a certain date. This gross value will be
+        # factored into various components of the debt, in an ordered manner. The first component of the debt to be
+        # amortized is the interest (spread). After payment of the interest, what remains must be deducted from the
+        # monetary correction. Finally, subtract the remaining value of the principal. In the block of code below,
+        #
+        #  • "val1" is the price level corrected interest to be paid;
+        #
+        #  • "val2" is the principal to be amortized.
+        #
+        # Observe that the order of calculation of these variables corresponds to the order of factorisation of the
+        # gross value of the advance.
+        #
+        else:
+            ent1 = t.cast(Amortization.Bare, ent1)  # Mypy can't infer the type of the "ent1" variable here.
+            bal0 = calc_balance(f_c)
+            val0 = min(ent1.value, bal0)
+            val1 = min(val0, regs.interest_accrued - regs.interest_settled_total)
+            val2 = val0 - val1
 
-                # Check if the irregular payment value doesn't exceed the remaining balance.
-                if ent1.value != Amortization.Bare.MAX_VALUE and ent1.value > _Q(calc_balance(f_c)):
-                    raise Exception(f'the value of the amortization, {ent1.value}, is greater than the remaining balance of the loan, {_Q(calc_balance(f_c))}')
+            # Check if the irregular payment value doesn't exceed the remaining balance.
+            if ent1.value != Amortization.Bare.MAX_VALUE and ent1.value > (bal1 := _Q(bal0)):
+                raise Exception(f'the value of the amortization, {ent1.value}, is greater than the remaining balance of the loan, {bal1}')
 
-                # Register the amortization percentage.
-                gens.principal_tracker_1.send(val2 / principal)
+            # Register the amortization percentage.
+            track_principal_1(val2 / principal)
 
-                # Register the interest to be settled in the period.
-                gens.interest_tracker_2.send(val1)
+            # Register the interest to be settled in the period.
+            track_interest_2(val1)
 
         # Phase B.2, FRD, or Phase Rafa Dois.
         #
         # Builds the payment instance, output of the routine. Performs rounding.
         #
-        if ent0.date < calc_date.value or ent1.date <= calc_date.value or calc_date.runaway:
-            pmt = PriceAdjustedPayment() if vir and vir.code == 'IPCA' else Payment()
+        pmt = PriceAdjustedPayment() if ipca else Payment()
 
-            # B.2.1. Monta o pagamento (PMT).
-            pmt.no = num
-            pmt.date = ent1.date
+        # B.2.1. Monta o pagamento (PMT).
+        pmt.no = num
+        pmt.date = ent1.date
 
-            if type(ent1) is Amortization:
-                pmt.amort = regs.principal.amortized.current
+        if type(ent1) is Amortization:
+            pmt.amort = regs.principal_amortized_current
 
-                if gain_output == 'deferred':
-                    pmt.gain = regs.interest.deferred + regs.interest.current
+            if gain_output == 'deferred':
+                pmt.gain = regs.interest_deferred + regs.interest_current
 
-                elif gain_output == 'settled':
-                    pmt.gain = regs.interest.settled.current if ent1.amortizes_interest else _0
+            elif gain_output == 'settled':
+                pmt.gain = regs.interest_settled_current if ent1.amortizes_interest else _0
 
-                else:  # Implies "gain_output == 'current'."
-                    pmt.gain = regs.interest.current
+            else:  # Implies "gain_output == 'current'."
+                pmt.gain = regs.interest_current
 
-                # Amortizes principal, does not incorporate interest.
-                if pmt.amort and ent1.amortizes_interest:
-                    pmt.raw = pmt.amort + (y := regs.interest.settled.current)
-                    pmt.tax = _0 if tax_exempt else y * calculate_revenue_tax(amortizations[0].date, due)
+            # Amortizes principal, does not incorporate interest.
+            if pmt.amort and ent1.amortizes_interest:
+                pmt.raw = pmt.amort + (y := regs.interest_settled_current)
+                pmt.tax = _0 if tax_exempt else y * calculate_revenue_tax(amortizations[0].date, due)
 
-                # Amortizes principal, incorporates interest.
-                elif pmt.amort:
-                    pmt.raw = pmt.amort
-                    pmt.tax = _0
+            # Amortizes principal, incorporates interest.
+            elif pmt.amort:
+                pmt.raw = pmt.amort
+                pmt.tax = _0
 
-                # Does not amortize principal, does not incorporate interest.
-                elif ent1.amortizes_interest:
-                    pmt.raw = regs.interest.settled.current
-                    pmt.tax = _0 if tax_exempt else pmt.raw * calculate_revenue_tax(amortizations[0].date, due)
+            # Does not amortize principal, does not incorporate interest.
+            elif ent1.amortizes_interest:
+                pmt.raw = regs.interest_settled_current
+                pmt.tax = _0 if tax_exempt else pmt.raw * calculate_revenue_tax(amortizations[0].date, due)
 
-                # Does not amortize principal, incorporates interest.
-                else:
-                    pmt.raw = _0
-                    pmt.tax = _0
+            # Does not amortize principal, incorporates interest.
+            else:
+                pmt.raw = _0
+                pmt.tax = _0
 
-                pmt.bal = calc_balance(f_c)
+            pmt.bal = calc_balance(f_c)
 
-                # Monetary correction.
-                #
-                # Notice that "pmt.pla" is the monetary correction of the principal amortization. This value does not account for
-                # the corrections to the interest paid in the current period, "pmt.gain".
-                #
-                # Applies the price level adjustment to the gross value, and to the revenue tax.
-                #
-                if vir and vir.code == 'IPCA':
-                    pmt = t.cast(PriceAdjustedPayment, pmt)
+            # Monetary correction.
+            #
+            # Notice that "pmt.pla" is the monetary correction of the principal amortization. This value does not account for
+            # the corrections to the interest paid in the current period, "pmt.gain".
+            #
+            # Applies the price level adjustment to the gross value, and to the revenue tax.
+            #
+            if ipca:
+                pmt = t.cast(PriceAdjustedPayment, pmt)
 
-                    # Pays monetary correction over the principal amortization.
-                    if (pla := t.cast(PriceLevelAdjustment, ent1.price_level_adjustment)) and pmt.amort:
-                        pmt.pla = pmt.amort * (f_c - 1)
+                # Pays monetary correction over the principal amortization.
+                if (pla := t.cast(PriceLevelAdjustment, ent1.price_level_adjustment)) and pmt.amort:
+                    pmt.pla = pmt.amort * (f_c - 1)
 
-                    # If there is no principal amortization in the period, and "pla.amortizes_adjustment" is true, then
-                    # "pmt.pla" will be the value of monetary correction of the outstanding balance. This s what
-                    # happens with loans that have the American Amortization system, by default. See the
-                    # "amortizes_correction" parameter on the "preprocess_jm" function.
-                    #
-                    elif pla and pla.amortizes_adjustment:
-                        pmt.pla = calc_balance(f_c) - calc_balance(_1)
+                # If there is no principal amortization in the period, and "pla.amortizes_adjustment" is true, then
+                # "pmt.pla" will be the value of monetary correction of the outstanding balance. This s what
+                # happens with loans that have the American Amortization system, by default. See the
+                # "amortizes_correction" parameter on the "preprocess_jm" function.
+                #
+                elif pla and pla.amortizes_adjustment:
+                    pmt.pla = calc_balance(f_c) - calc_balance(_1)
 
-                    pmt.raw = pmt.raw + pmt.pla
-                    pmt.tax = _0 if tax_exempt else pmt.tax + pmt.pla * calculate_revenue_tax(amortizations[0].date, due)
+                pmt.raw = pmt.raw + pmt.pla
+                pmt.tax = _0 if tax_exempt else pmt.tax + pmt.pla * calculate_revenue_tax(amortizations[0].date, due)
 
-            else:  # Implies "type(ent1) is Amortization.Bare".
-                pmt.amort = regs.principal.amortized.current
+        else:  # Implies "type(ent1) is Amortization.Bare".
+            pmt.amort = regs.principal_amortized_current
 
-                if gain_output == 'deferred':
-                    pmt.gain = regs.interest.deferred + regs.interest.current
+            if gain_output == 'deferred':
+                pmt.gain = regs.interest_deferred + regs.interest_current
 
-                elif gain_output == 'settled':
-                    pmt.gain = regs.interest.settled.current
+            elif gain_output == 'settled':
+                pmt.gain = regs.interest_settled_current
 
-                else:  # Implies "gain_output == 'current'."
-                    pmt.gain = regs.interest.current
+            else:  # Implies "gain_output == 'current'."
+                pmt.gain = regs.interest_current
 
-                pmt.raw = pmt.amort + (y := regs.interest.settled.current)
-                pmt.tax = _0 if tax_exempt else y * calculate_revenue_tax(amortizations[0].date, due)
+            pmt.raw = pmt.amort + (y := regs.interest_settled_current)
+            pmt.tax = _0 if tax_exempt else y * calculate_revenue_tax(amortizations[0].date, due)
 
-                if vir and vir.code == 'IPCA':
-                    pmt = t.cast(PriceAdjustedPayment, pmt)
+            if ipca:
+                pmt = t.cast(PriceAdjustedPayment, pmt)
 
-                    pmt.pla = pmt.amort * (f_c - 1)
-                    pmt.raw = pmt.raw + pmt.pla
-                    pmt.tax = _0 if tax_exempt else pmt.tax + pmt.pla * calculate_revenue_tax(amortizations[0].date, due)
+                pmt.pla = pmt.amort * (f_c - 1)
+                pmt.raw = pmt.raw + pmt.pla
+                pmt.tax = _0 if tax_exempt else pmt.tax + pmt.pla * calculate_revenue_tax(amortizations[0].date, due)
 
-                pmt.bal = calc_balance(f_c)
+            pmt.bal = calc_balance(f_c)
 
-            # Sanity check.
-            #
-            # Esse teste de sanidade só é necessário caso três critérios sejam atendidos:
-            #
-            #   1. Que a entrada do cronograma seja uma antecipação, "Amortization.Bare".
-            #
-            #   2. Que a antecipação esteja na data de cálculo. Se não estiver, obviamente, os valores não vão bater.
-            #
-            #   3. Que o valor da antecipação não seja "Amortization.Bare.MAX_VALUE". Nesse caso a rotina usaria o
-            #      saldo devedor na data do cálculo como valor da antecipação. Não haveria "input" a ser validado.
-            #
-            if type(ent1) is Amortization.Bare and ent1.date == calc_date.value and ent1.value < Amortization.Bare.MAX_VALUE:
-                assert _Q(pmt.raw) == _Q(ent1.value)
+        # Sanity check.
+        #
+        # Esse teste de sanidade só é necessário caso três critérios sejam atendidos:
+        #
+        #   1. Que a entrada do cronograma seja uma antecipação, "Amortization.Bare".
+        #
+        #   2. Que a antecipação esteja na data de cálculo. Se não estiver, obviamente, os valores não vão bater.
+        #
+        #   3. Que o valor da antecipação não seja "Amortization.Bare.MAX_VALUE". Nesse caso a rotina usaria o
+        #      saldo devedor na data do cálculo como valor da antecipação. Não haveria "input" a ser validado.
+        #
+        if type(ent1) is Amortization.Bare and ent1.date == calc_date.value and ent1.value < Amortization.Bare.MAX_VALUE:
+            assert _Q(pmt.raw) == _Q(ent1.value)
 
-            # B.2.2. Arredonda valores do pagamento, e calcula o seu valor líquido.
-            pmt.amort = _Q(pmt.amort)
-            pmt.gain = _Q(pmt.gain)
-            pmt.raw = _Q(pmt.raw)
-            pmt.tax = _Q(pmt.tax)
-            pmt.net = pmt.raw - pmt.tax
-            pmt.bal = _Q(pmt.bal)
+        # B.2.2. Arredonda valores do pagamento, e calcula o seu valor líquido.
+        pmt.amort = _Q(pmt.amort)
+        pmt.gain = _Q(pmt.gain)
+        pmt.raw = _Q(pmt.raw)
+        pmt.tax = _Q(pmt.tax)
+        pmt.net = pmt.raw - pmt.tax
+        pmt.bal = _Q(pmt.bal)
 
-            pmt.sf = f_s
-            pmt.vf = f_v.value
+        pmt.sf = f_s
+        pmt.vf = f_v.value
 
-            if vir and vir.code == 'IPCA':
-                pmt = t.cast(PriceAdjustedPayment, pmt)
+        if ipca:
+            pmt = t.cast(PriceAdjustedPayment, pmt)
 
-                pmt.pla = _Q(pmt.pla)
+            pmt.pla = _Q(pmt.pla)
 
-                pmt.cf = f_c
+            pmt.cf = f_c
 
-            # B.2.3. Faz uma cópia dos registradores para a saída de pagamento.
-            pmt._regs = copy.deepcopy(regs)
+        # B.2.3. Faz uma cópia dos registradores para a saída de pagamento.
+        pmt._regs = copy.copy(regs)
 
-            yield pmt
+        yield pmt
 
-            if pmt.bal == _0:
-                break  # Se o saldo é zero, o cronograma acabou.
+        if pmt.bal == _0:
+            break  # Se o saldo é zero, o cronograma acabou.
 # }}}
 
 # Public API. Daily returns. {{{
@@ -1979,8 +2347,8 @@ def get_payments_table(
 #
 # Notice that although the description of how the interest of a day D is calculated is quite simple, the implementation
 # a lot more complex. Computing the total accumulated return since the start of the loan, or from the last payment, up
-# to day D-1, is easy. Those values are given by the "regs.interest.accrued" and "regs.interest.current +
-# regs.interest.deferred" expressions, respectively. But neither the computation of the current daily return, nor the
+# to day D-1, is easy. Those values are given by the "regs.interest_accrued" and "regs.interest_current +
+# regs.interest_deferred" expressions, respectively. But neither the computation of the current daily return, nor the
 # computation of the total return, up to day D, are trivial tasks.
 #
 # This algorithm will work with the accumulated interest factors instead of the accumulated return values. As stated,
@@ -2015,7 +2383,7 @@ def get_payments_table(
 #
 # A conversation with ChatGPT about price level: https://chatgpt.com/share/670ff365-87a4-800f-a89b-50b37a6a052d.
 #
-@typeguard.typechecked
+@_typechecked
 def get_daily_returns(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -2072,23 +2440,33 @@ def get_daily_returns(
       • "fc", is the monetary correction component of the day's yield.
     '''
 
+    # As in "get_payments_table", the multiplications by the neutral factor are skipped.
+    #
     def calc_balance(correction_factor: decimal.Decimal = _1) -> decimal.Decimal:
-        val = principal * correction_factor + regs.interest.accrued - regs.principal.amortized.total * correction_factor - regs.interest.settled.total
+        if correction_factor is _1:
+            val = principal + regs.interest_accrued - regs.principal_amortized_total - regs.interest_settled_total
+
+        else:
+            val = principal * correction_factor + regs.interest_accrued - regs.principal_amortized_total * correction_factor - regs.interest_settled_total
 
         return t.cast(decimal.Decimal, val)
 
     def get_principal_outstanding(correction_factor: decimal.Decimal = _1) -> decimal.Decimal:
-        val = (principal - regs.principal.amortized.total) * correction_factor
+        if correction_factor is _1:
+            val = principal - regs.principal_amortized_total
+
+        else:
+            val = (principal - regs.principal_amortized_total) * correction_factor
 
         return t.cast(decimal.Decimal, val)
 
-    # First generator for principal values.
+    # First tracker for principal values.
     #
-    #  • "regs.principal.amortization_ratio.adjusted", is the adjusted accumulated percentage of amortization since the start of the loan.
+    #  • "regs.principal_ratio_adjusted", is the adjusted accumulated percentage of amortization since the start of the loan.
     #
-    #  • "regs.principal.amortized.current", is the value amortized in the current micro period.
+    #  • "regs.principal_amortized_current", is the value amortized in the current micro period.
     #
-    #  • "regs.principal.amortized.total", is the total amortized value since the start of the loan.
+    #  • "regs.principal_amortized_total", is the total amortized value since the start of the loan.
     #
     # Adjusting Amortization Ratios
     # -----------------------------
@@ -2105,86 +2483,80 @@ def get_daily_returns(
     # (advancements), and AREG is the total remaining amortization percentage of regular payments. See phase FRO (Phase
     # Rafa One) below
     #
-    def track_principal_1() -> t.Generator[None, decimal.Decimal | None, None]:
-        while True:
-            ratio = yield
+    def track_principal_1(ratio: decimal.Decimal) -> None:
+        # O percentual de amortização não deve ultrapassar 100%.
+        if regs.principal_ratio_adjusted + ratio > _1:
+            ratio = _1 - regs.principal_ratio_adjusted
 
-            # O percentual de amortização não deve ultrapassar 100%.
-            if regs.principal.amortization_ratio.adjusted + ratio > _1:
-                ratio = _1 - regs.principal.amortization_ratio.adjusted
+        if ratio:
+            regs.principal_ratio_adjusted += ratio
+            regs.principal_amortized_current = ratio * principal
+            regs.principal_amortized_total = regs.principal_ratio_adjusted * principal
 
-            if ratio:
-                regs.principal.amortization_ratio.adjusted += ratio
-                regs.principal.amortized = types.SimpleNamespace(current=ratio * principal, total=regs.principal.amortization_ratio.adjusted * principal)
-
-            else:
-                regs.principal.amortized = types.SimpleNamespace(current=_0, total=regs.principal.amortized.total)
+        else:
+            regs.principal_amortized_current = _0
 
-    # Second generator for principal values.
+    # Second tracker for principal values.
     #
-    #  • "regs.principal.amortization_ratio.nominal", is the adjusted nominal amortization percentage.
+    #  • "regs.principal_ratio_nominal", is the adjusted nominal amortization percentage.
     #
-    def track_principal_2() -> t.Generator[None, decimal.Decimal | None, None]:
-        while True:
-            ratio = yield
-
-            # O percentual de amortização não deve ultrapassar 100%.
-            if regs.principal.amortization_ratio.nominal + ratio > _1:
-                ratio = _1 - regs.principal.amortization_ratio.nominal
+    def track_principal_2(ratio: decimal.Decimal) -> None:
+        # O percentual de amortização não deve ultrapassar 100%.
+        if regs.principal_ratio_nominal + ratio > _1:
+            ratio = _1 - regs.principal_ratio_nominal
 
-            if ratio:
-                regs.principal.amortization_ratio.nominal += ratio
+        if ratio:
+            regs.principal_ratio_nominal += ratio
 
-    # Generator for interest values.
+    # Tracker for interest values.
     #
-    #   • "regs.interest.daily" is the accrued interest (produced) on the day.
+    #   • "regs.interest_daily" is the accrued interest (produced) on the day.
     #
-    #   • "regs.interest.current" is the accrued interest (produced) on the current micro period. Regardless of whether a
+    #   • "regs.interest_current" is the accrued interest (produced) on the current micro period. Regardless of whether a
     #      payment was made in the previous period. If the previous period was a grace period, its interest won't
-    #      accumulate on "interest.current". It will be available as "regs.interest.deferred".
+    #      accumulate on "interest_current". It will be available as "regs.interest_deferred".
     #
-    #   • "regs.interest.accrued" is the total of accrued interest since the start of the loan.
+    #   • "regs.interest_accrued" is the total of accrued interest since the start of the loan.
     #
-    # This generator is called once per day.
+    # This tracker is called once per day. Like the others, it was once a coroutine, resumed with "send". A plain call
+    # costs less than resuming a generator frame, and the trackers keep all of their state in the registers anyway.
     #
-    def track_interest_1() -> t.Generator[None, decimal.Decimal | None, None]:
-        while True:
-            regs.interest.daily = yield
-            regs.interest.current += regs.interest.daily
-            regs.interest.accrued += regs.interest.daily
+    def track_interest_1(value: decimal.Decimal) -> None:
+        regs.interest_daily = value
+        regs.interest_current += regs.interest_daily
+        regs.interest_accrued += regs.interest_daily
 
     # Keeps track of settled and deferred interest values.
     #
-    #   • "regs.interest.settled.current" are the settled interest on the current micro period.
+    #   • "regs.interest_settled_current" are the settled interest on the current micro period.
     #
-    #   • "regs.interest.settled.total" is the total settled interest since the start of the loan.
+    #   • "regs.interest_settled_total" is the total settled interest since the start of the loan.
     #
-    #   • "regs.interest.deferred" is the total deferred interest from past periods.
+    #   • "regs.interest_deferred" is the total deferred interest from past periods.
     #
-    # This generator will be called on micro periods ending by regular or advanced payments. On grace periods, it will
-    # not be called.
+    # This tracker will be called on micro periods ending by regular or advanced payments. On grace periods, it will not
+    # be called.
     #
-    def track_interest_2() -> t.Generator[None, decimal.Decimal | None, None]:
-        while True:
-            regs.interest.settled = types.SimpleNamespace(current=(yield), total=regs.interest.settled.total)
-            regs.interest.settled.total += regs.interest.settled.current
-            regs.interest.deferred = regs.interest.accrued - regs.interest.settled.total
+    def track_interest_2(value: decimal.Decimal) -> None:
+        regs.interest_settled_current = value
+        regs.interest_settled_total += regs.interest_settled_current
+        regs.interest_deferred = regs.interest_accrued - regs.interest_settled_total
 
     def normalize_fixed_factors() -> t.Generator[FactorTriplet, None, None]:
-        lst = [x for x in amortizations if type(x) is Amortization]
         acc = FactorTriplet()
 
-        for amort0, amort1 in itertools.pairwise(lst):
-            if capitalisation in ['360', '365', '252']:
-                fac = calculate_interest_factor(apy, _1 / decimal.Decimal(capitalisation))
+        # With a daily capitalisation, the daily factor is the same for all periods.
+        if capitalisation in ['360', '365', '252']:
+            fac = calculate_interest_factor(apy, _fraction(1, int(capitalisation)))
 
-            else:  # Implies "capitalisation == 30/360".
+        for amort0, amort1 in itertools.pairwise(regular):
+            if capitalisation == '30/360':
                 dct = (amort1.date - amort0.date).days
 
                 # Exclusively for the first anniversary date, "DCT" will be considered as the difference in calendar
                 # days between the 24th day before and the 24th day after the start of the loan.
                 #
-                if amort1.dct_override and amort0 is lst[0]:
+                if amort1.dct_override and amort0 is regular[0]:
                     dct = _diff_surrounding_dates(amort0.date, 24)
 
                 elif amort1.dct_override:
@@ -2199,70 +2571,66 @@ def get_daily_returns(
                     if amort0.dct_override.predates_first_amortization:
                         dct = _diff_surrounding_dates(amort0.dct_override.date_from, 24)
 
-                fac = calculate_interest_factor(apy, _1 / decimal.Decimal(12 * dct))
+                fac = calculate_interest_factor(apy, _fraction(1, 12 * dct))
 
-            for _ in _date_range(amort0.date, amort1.date):
+            for _ in range((amort1.date - amort0.date).days):
                 acc = acc * fac
 
                 yield acc
 
     def normalize_cdi_indexes(backend: IndexStorageBackend) -> t.Generator[FactorTriplet, None, None]:
-        gen = backend.get_cdi_indexes(amortizations[0].date, amortizations[-1].date - datetime.timedelta(days=1))
-        pct = vir.percentage / decimal.Decimal(100) if vir else _1
-        idx = next(gen, None)
+        pct = _percentage_ratio(vir.percentage) if vir else _1
         acc = FactorTriplet()
 
+        # The indexes are fetched at once, and looked up by ordinal. Days without an index are reported, but still yield.
+        #
+        # The main loop of the routine already builds a date for every day, so this one walks ordinals, and builds a
+        # date only to report a missing index.
+        #
+        tab = {x.date.toordinal(): x.value for x in backend.get_cdi_indexes(amortizations[0].date, amortizations[-1].date - datetime.timedelta(days=1))}
+
         for amort0, amort1 in itertools.pairwise(amortizations):
-            for ref in _date_range(amort0.date, amort1.date):
-                if idx and ref == idx.date and idx.value > 0:
-                    acc = acc * (idx.value * pct / decimal.Decimal(100) + _1)
+            for ref in range(amort0.date.toordinal(), amort1.date.toordinal()):
+                if (val := tab.get(ref)) is not None and val > 0:
+                    acc = acc * (val * pct / _100 + _1)
 
                     yield acc
 
-                    idx = next(gen, None)
-
-                elif idx and ref == idx.date:
+                elif val is not None:
                     acc = acc * _1  # This multiplication is not a no-op!
 
                     yield acc
 
-                    idx = next(gen, None)
-
                 else:
                     acc = acc * _1  # This multiplication is not a no-op!
 
                     yield acc
 
-                    _LOG.warning(f'CDI index for date {ref} was not found')
+                    _LOG.warning(f'CDI index for date {datetime.date.fromordinal(ref)} was not found')
 
     # Poupança is a monthly index. This function will normalize it to daily values.
     def normalize_poupanca_indexes(backend: IndexStorageBackend) -> t.Generator[FactorTriplet, None, None]:
         pct = t.cast(VariableIndex, vir).percentage  # Mypy fails to detect that, despite "vir" being optional, here it can't be None.
         acc = FactorTriplet()
 
-        for amort0, amort1 in itertools.pairwise([x for x in amortizations if type(x) is Amortization]):
+        for amort0, amort1 in itertools.pairwise(regular):
             for dt0, dt1 in _generate_monthly_dates(amort0.date, amort1.date):
                 if (obj := backend.calculate_savings_factor(dt0, dt1, pct)).amount:
                     fac = calculate_interest_factor(obj.value - _1, _1 / decimal.Decimal((dt1 - dt0).days), False)
 
-                    while dt0 < dt1:
+                    for _ in range((dt1 - dt0).days):
                         acc = acc * fac
 
                         yield acc
 
-                        dt0 += datetime.timedelta(days=1)
-
                 else:
-                    while dt0 < dt1:
+                    for _ in range((dt1 - dt0).days):
                         acc = acc * _1  # This multiplication is not a no-op!
 
                         yield acc
 
-                        dt0 += datetime.timedelta(days=1)
-
     # IPCA is a monthly index. This function will normalize it to daily values.
     def normalize_ipca_indexes(backend: IndexStorageBackend) -> t.Generator[FactorTriplet, None, None]:
-        lst = [x for x in amortizations if type(x) is Amortization]
         acc = FactorTriplet()
 
         # FIXME 1: write a Bullet IPCA test, to cover the "if" block below.
@@ -2270,8 +2638,8 @@ def get_daily_returns(
         # FIXME 2: write another test case to ensure that the Bullet IPCA payments generated with "get_payments_table"
         # match the values generated by this function.
         #
-        if len(lst) == 2:
-            for amort0, amort1 in itertools.pairwise(lst):
+        if len(regular) == 2:
+            for amort0, amort1 in itertools.pairwise(regular):
                 for i, (dt0, dt1) in enumerate(_generate_monthly_dates(amort0.date, amort1.date)):
                     if (pla := amort1.price_level_adjustment) and pla.base_date:
                         kwa: t.Dict[str, t.Any] = {}
@@ -2301,31 +2669,25 @@ def get_daily_returns(
                             fac = max(obj.value, _1) - _1
                             fac = calculate_interest_factor(fac, _1 / decimal.Decimal(dcp), False)
 
-                            while dt0 < dt1:
+                            for _ in range((dt1 - dt0).days):
                                 acc = acc * fac
 
                                 yield acc
 
-                                dt0 += datetime.timedelta(days=1)
-
                         else:
-                            while dt0 < dt1:
+                            for _ in range((dt1 - dt0).days):
                                 acc = acc * _1  # This multiplication is not a no-op!
 
                                 yield acc
 
-                                dt0 += datetime.timedelta(days=1)
-
                     else:
-                        while dt0 < amort1.date:
+                        for _ in range((amort1.date - dt0).days):
                             acc = acc * _1  # This multiplication is not a no-op!
 
                             yield acc
 
-                            dt0 += datetime.timedelta(days=1)
-
         else:
-            for i, (amort0, amort1) in enumerate(itertools.pairwise(lst)):
+            for i, (amort0, amort1) in enumerate(itertools.pairwise(regular)):
                 dt0 = amort0.date
 
                 if (pla := amort1.price_level_adjustment) and pla.base_date:
@@ -2356,32 +2718,25 @@ def get_daily_returns(
                         fac = max(obj.value, _1) - _1
                         fac = calculate_interest_factor(fac, _1 / decimal.Decimal(dcp), False)
 
-                        while dt0 < amort1.date:
+                        for _ in range((amort1.date - dt0).days):
                             acc = acc * fac
 
                             yield acc
 
-                            dt0 += datetime.timedelta(days=1)
-
                     else:
-                        while dt0 < amort1.date:
+                        for _ in range((amort1.date - dt0).days):
                             acc = acc * _1  # This multiplication is not a no-op!
 
                             yield acc
 
-                            dt0 += datetime.timedelta(days=1)
-
                 else:
-                    while dt0 < amort1.date:
+                    for _ in range((amort1.date - dt0).days):
                         acc = acc * _1  # This multiplication is not a no-op!
 
                         yield acc
 
-                        dt0 += datetime.timedelta(days=1)
-
     # A. Valida e prepara para execução.
-    gens = types.SimpleNamespace()
-    regs = types.SimpleNamespace()
+    regs = _DailyRegisters()
     idxs = types.SimpleNamespace()
     facs = types.SimpleNamespace()
     aux = _0
@@ -2405,11 +2760,14 @@ def get_daily_returns(
     elif vir and vir.code == 'CDI' and capitalisation != '252':
         raise ValueError('CDI should use the 252 working days capitalisation')
 
+    # Whether a price level adjustment in the schedule is an error. As in "get_payments_table", it's checked only once.
+    bad = bool(vir and vir.code not in _PL_INDEX_CODES)
+
     for i, x in enumerate(amortizations):
         if type(x) is Amortization:
             aux += x.amortization_ratio
 
-        if vir and vir.code not in t.get_args(_PL_INDEX) and type(x) is Amortization and x.price_level_adjustment:
+        if bad and type(x) is Amortization and x.price_level_adjustment:
             raise TypeError(f"amortization {i} has price level adjustment, but a variable index wasn't provided, or isn't IPCA nor IGPM")
 
         elif aux > _1 and not math.isclose(aux, _1):
@@ -2418,21 +2776,8 @@ def get_daily_returns(
     if not math.isclose(aux, _1):
         raise ValueError('the accumulated percentage of the amortizations does not reach 1.0')
 
-    # Registradores.
-    regs.principal = types.SimpleNamespace(amortization_ratio=types.SimpleNamespace(adjusted=_0, nominal=_0), amortized=types.SimpleNamespace(current=_0, total=_0))
-    regs.interest = types.SimpleNamespace(daily=_0, current=_0, accrued=_0, settled=types.SimpleNamespace(current=_0, total=_0), deferred=_0)
-
-    # Control, create generators.
-    gens.interest_tracker_1 = track_interest_1()
-    gens.interest_tracker_2 = track_interest_2()
-    gens.principal_tracker_1 = track_principal_1()
-    gens.principal_tracker_2 = track_principal_2()
-
-    # Control, start generators.
-    gens.principal_tracker_1.send(None)
-    gens.principal_tracker_2.send(None)
-    gens.interest_tracker_1.send(None)
-    gens.interest_tracker_2.send(None)
+    # The regular amortizations, without advancements. Shared by the fixed factors generator and the monthly index ones.
+    regular = [x for x in amortizations if type(x) is Amortization]
 
     idxs.fixed = normalize_fixed_factors()
 
@@ -2448,10 +2793,21 @@ def get_daily_returns(
     elif vir:
         raise NotImplementedError(f'unsupported variable index {vir}')
 
+    # The factors to calculate depend only on the index and the capitalisation, so the combination is checked once, not
+    # on every day of the schedule.
+    if vir and (vir.code, capitalisation) not in _VIR_CAPITALISATIONS:
+        raise NotImplementedError(f'combination of variable interest rate {vir} and capitalisation {capitalisation} unsupported')
+
+    elif not vir and capitalisation not in _FIXED_CAPITALISATIONS:
+        raise NotImplementedError(f'unsupported capitalisation {capitalisation} for fixed interest rate')
+
     # B. Execute.
     itr = iter(amortizations)
     tup = next(itr), next(itr)
-    end = amortizations[-1].date
+    code = vir.code if vir else None
+    ipca = code == 'IPCA'
+    last = amortizations[-1].date
+    end = last
     cnt = p = 1
     buf = _0
 
@@ -2472,21 +2828,15 @@ def get_daily_returns(
         #
         # Simplified form of FZA from "get_payments_table".
         #
-        if ref < amortizations[-1].date and not vir and capitalisation == '360':  # Bullet.
-            facs.spread = facs.spread.normalize(next(idxs.fixed))
-
-        elif ref < amortizations[-1].date and not vir and capitalisation == '365':  # Bullet in legacy mode.
-            facs.spread = facs.spread.normalize(next(idxs.fixed))
-
-        # Monthly fixed rate, 30/360.
+        # Fixed rate. Bullet (360 or, in legacy mode, 365), Juros mensais, Price and Livre (30/360).
         #
-        # Calculation of DT, from DP/DT. Notice that here, DP == 1, since we are working with the smallest fraction of
-        # a factor, a day.
+        # On a monthly fixed rate, 30/360, the calculation of DT, from DP/DT, is done by the generator of fixed factors.
+        # Notice that here, DP == 1, since we are working with the smallest fraction of a factor, a day.
         #
-        elif ref < amortizations[-1].date and not vir and capitalisation == '30/360':  # Juros mensais, Price, Livre.
+        if ref < last and not code:
             facs.spread = facs.spread.normalize(next(idxs.fixed))
 
-        elif ref < amortizations[-1].date and vir and vir.code == 'CDI' and capitalisation == '252':  # Bullet, Juros mensais, Livre.
+        elif ref < last and code == 'CDI':  # Bullet, Juros mensais, Livre.
             facs.variable = facs.variable.normalize(next(idxs.variable))
 
             # Note that the index on a 252 basis only earns on a business day. This is how the CDI works. In this case
@@ -2503,53 +2853,42 @@ def get_daily_returns(
             else:
                 facs.spread = facs.spread.normalize(facs.spread * _1)  # This multiplication is not a no-op!
 
-        elif ref < amortizations[-1].date and vir and vir.code == 'Poupança' and capitalisation == '360':  # Poupança is supported only with Bullet.
+        elif ref < last and code == 'Poupança':  # Poupança is supported only with Bullet.
             facs.spread = facs.spread.normalize(next(idxs.fixed))
             facs.variable = facs.variable.normalize(next(idxs.variable))
 
-        elif ref < amortizations[-1].date and vir and vir.code == 'IPCA' and capitalisation == '360':  # Bullet.
-            facs.spread = facs.spread.normalize(next(idxs.fixed))
-            facs.correction = facs.correction.normalize(next(idxs.variable))
-
-        # Monthly IPCA rate, 30/360.
-        #
-        # Same logic as the monthly fixed rate, 30/360, but with the added price level adjustment. See comments above.
+        # IPCA, either Bullet (360), or Juros mensais and Livre (30/360). Same logic as the fixed rate, but with the added
+        # price level adjustment.
         #
-        elif ref < amortizations[-1].date and vir and vir.code == 'IPCA' and capitalisation == '30/360':  # Juros mensais, Livre.
+        elif ref < last and code == 'IPCA':
             facs.spread = facs.spread.normalize(next(idxs.fixed))
             facs.correction = facs.correction.normalize(next(idxs.variable))
 
-        elif ref < amortizations[-1].date and vir:
-            raise NotImplementedError(f'combination of variable interest rate {vir} and capitalisation {capitalisation} unsupported')
-
-        elif ref < amortizations[-1].date:
-            raise NotImplementedError(f'unsupported capitalisation {capitalisation} for fixed interest rate')
-
         # Phase B.1, FRONG, or Phase Rafa One, Next Gen.
         #
         # In this phase we process amortizations, interest payments etc.
         #
         # Slightly altered with respect to FRO from the "get_payments_table" routine.
         #
-        while ref < amortizations[-1].date and ref == tup[1].date:
+        while ref < last and ref == tup[1].date:
             if not buf and not is_bizz_day_cb(ref):
                 buf = _Q(calc_balance(facs.correction.value))
 
             if type(tup[1]) is Amortization:  # Case of a regular amortization.
-                adj = (_1 - regs.principal.amortization_ratio.adjusted) / (_1 - regs.principal.amortization_ratio.nominal)  # [FATOR-AJUSTE].
+                adj = (_1 - regs.principal_ratio_adjusted) / (_1 - regs.principal_ratio_nominal)  # [FATOR-AJUSTE].
 
                 # Registers the adjusted amortization percentage.
-                gens.principal_tracker_1.send(tup[1].amortization_ratio * adj)
+                track_principal_1(tup[1].amortization_ratio * adj)
 
                 # Registers the nominal amortization percentage.
-                gens.principal_tracker_2.send(tup[1].amortization_ratio)
+                track_principal_2(tup[1].amortization_ratio)
 
                 # Registers the interest value to be settled in the period.
                 if tup[1].amortizes_interest:
-                    pct = regs.principal.amortization_ratio.adjusted * adj
-                    pt2 = pct * (regs.interest.accrued - regs.interest.settled.total - regs.interest.current)
+                    pct = regs.principal_ratio_adjusted * adj
+                    pt2 = pct * (regs.interest_accrued - regs.interest_settled_total - regs.interest_current)
 
-                    gens.interest_tracker_2.send(regs.interest.current + pt2)
+                    track_interest_2(regs.interest_current + pt2)
 
                 # The interest factors have to be renormalized on principal changes. See comments above.
                 if tup[1].amortization_ratio > 0 or tup[1].amortizes_interest:
@@ -2560,7 +2899,7 @@ def get_daily_returns(
                 # The macro period only increments in the case of regular amortizations.
                 p, cnt = p + 1, 1
 
-                regs.interest.current = _0
+                regs.interest_current = _0
 
             # Case of an advance (extraordinary amortization). See comments of the similar block in "get_payments_table".
             #
@@ -2573,17 +2912,17 @@ def get_daily_returns(
             else:
                 ent = t.cast(Amortization.Bare, tup[1])  # O Mypy não consegue inferir o tipo da variável "ent" aqui.
                 val0 = min(ent.value, calc_balance(facs.correction.value))
-                val1 = min(val0, regs.interest.accrued - regs.interest.settled.total)
+                val1 = min(val0, regs.interest_accrued - regs.interest_settled_total)
                 val2 = val0 - val1
 
                 # Registers the amortization percentage.
-                gens.principal_tracker_1.send(val2 / principal)
+                track_principal_1(val2 / principal)
 
                 # Registers the interest value to be settled in the period.
-                gens.interest_tracker_2.send(val1)
+                track_interest_2(val1)
 
                 # Checks if we did not amortize more than the remaining principal.
-                if regs.principal.amortized.total > principal:
+                if regs.principal_amortized_total > principal:
                     raise Exception(f'the value of the amortization, {ent.value}, is greater than the remaining balance of the loan, {_Q(calc_balance(facs.correction.value))}')
 
                 # The interest factors have to be renormalized on principal changes. See comments above.
@@ -2591,7 +2930,7 @@ def get_daily_returns(
                 facs.variable = facs.variable.normalize()
                 facs.correction = facs.correction.normalize()
 
-                regs.interest.current = _0
+                regs.interest_current = _0
 
             tup = tup[1], next(itr)
 
@@ -2600,18 +2939,29 @@ def get_daily_returns(
         # The interest have to be calculated after processing all amortizations of the current day, i.e., after phase
         # B.1 above. This way we get the correct balance value to apply the factors on.
         #
-        v0 = (facs.spread.prev_value * facs.variable.prev_value - _1) * get_principal_outstanding(facs.correction.prev_value) + regs.interest.deferred
-        v1 = (facs.spread.value * facs.variable.value - _1) * get_principal_outstanding(facs.correction.value) + regs.interest.deferred
+        # The correction factors, and the corrected outstanding principal, don't change from here to the end of the day.
+        # So they are computed once, and reused on the balance and on the price level adjustment below.
+        #
+        # Without a monetary correction the correction triplet stays neutral, so its factors are exactly one, and the
+        # neutral constant is used instead, skipping the multiplications.
+        #
+        cf0 = facs.correction.prev_value if ipca else _1
+        cf1 = facs.correction.value if ipca else _1
+        po0 = get_principal_outstanding(cf0)
+        po1 = get_principal_outstanding(cf1)
+
+        v0 = (facs.spread.prev_value * facs.variable.prev_value - _1) * po0 + regs.interest_deferred
+        v1 = (facs.spread.value * facs.variable.value - _1) * po1 + regs.interest_deferred
 
-        gens.interest_tracker_1.send(v1 - v0)
+        track_interest_1(v1 - v0)
 
         # Builds the daily return instance, output of the routine. Makes rounding.
-        dr = PriceAdjustedDailyReturn() if vir and vir.code == 'IPCA' else DailyReturn()
+        dr = PriceAdjustedDailyReturn() if ipca else DailyReturn()
 
         dr.no = cnt
         dr.period = p
         dr.date = ref
-        dr.value = _Q(regs.interest.daily)
+        dr.value = _Q(regs.interest_daily)
 
         if buf and not is_bizz_day_cb(ref):
             buf = buf + dr.value
@@ -2621,22 +2971,24 @@ def get_daily_returns(
         else:
             buf = _0
 
-            dr.bal = _Q(calc_balance(facs.correction.value))  # Balance at the end of the day.
+            dr.bal = _Q(calc_balance(cf1))  # Balance at the end of the day.
 
         dr.sf = facs.spread.discrete
         dr.vf = facs.variable.discrete
 
-        if vir and vir.code == 'IPCA':
+        if ipca:
             dr = t.cast(PriceAdjustedDailyReturn, dr)
-            v0 = get_principal_outstanding(facs.correction.prev_value) + regs.interest.deferred
-            v1 = get_principal_outstanding(facs.correction.value) + regs.interest.deferred
+            v0 = po0 + regs.interest_deferred
+            v1 = po1 + regs.interest_deferred
 
             dr.pla = _Q(v1 - v0)
 
             dr.cf = facs.correction.discrete
 
-        _LOG.debug(f'T={p}, n={cnt}, f_s={facs.spread} f_v={facs.variable} f_c={facs.correction}')
-        _LOG.debug(f'T={p}, n={cnt}, regs={regs}')
+        # Lazily formatted, as formatting the triplets and the registers of every day is costly, and debug logging is
+        # usually off.
+        _LOG.debug('T=%s, n=%s, f_s=%s f_v=%s f_c=%s', p, cnt, facs.spread, facs.variable, facs.correction)
+        _LOG.debug('T=%s, n=%s, regs=%s', p, cnt, regs)
 
         # If the outstanding principal is zero, and the current day is a business day, the schedule is over.
         if _Q(get_principal_outstanding()) != _0 or not is_bizz_day_cb(ref):
@@ -2665,11 +3017,14 @@ def preprocess_bullet(
     if term <= 0:  # See [ANNOTATED_TYPES] above.
         raise ValueError('"term" must be a greater than, or equal to, one')
 
+    # The regular payment date. Computed once, as it's used throughout the routine.
+    due = zero_date + _MONTH * term
+
     if anniversary_date and anniversary_date <= zero_date:
         raise ValueError(f'the "anniversary_date", {anniversary_date}, must be greater than "zero_date", {zero_date}')
 
-    elif anniversary_date and abs((anniversary_date - (zero_date + _MONTH * term)).days) > 20:
-        raise ValueError(f'the "anniversary_date", {anniversary_date}, is more than 20 days away from the regular payment date, {zero_date + _MONTH * term}')
+    elif anniversary_date and abs((anniversary_date - due).days) > 20:
+        raise ValueError(f'the "anniversary_date", {anniversary_date}, is more than 20 days away from the regular payment date, {due}')
 
     for i, x in enumerate(insertions):
         if x.value <= 0:
@@ -2678,7 +3033,7 @@ def preprocess_bullet(
         elif x.date <= zero_date:
             raise ValueError(f'"insertions[{i}].date", {x.date}, must succeed "zero_date", {zero_date}')
 
-        elif not anniversary_date and x.date > (due := zero_date + _MONTH * term):
+        elif not anniversary_date and x.date > due:
             raise ValueError(f'"insertions[{i}].date", {x.date}, succeeds the regular payment date, {due}')
 
         elif anniversary_date and x.date > anniversary_date:
@@ -2691,7 +3046,7 @@ def preprocess_bullet(
     # 2.1. Create the amortizations. Regular flow, without insertions. Fast.
     if not insertions and not vir:
         sched.append(Amortization(date=zero_date, amortizes_interest=False))
-        sched.append(Amortization(date=anniversary_date or zero_date + _MONTH * term, amortization_ratio=_1))
+        sched.append(Amortization(date=anniversary_date or due, amortization_ratio=_1))
 
         if anniversary_date:
             sched[-1].dct_override = DctOverride(anniversary_date, anniversary_date, predates_first_amortization=False)
@@ -2702,7 +3057,7 @@ def preprocess_bullet(
         pla = PriceLevelAdjustment('IPCA', base_date=zero_date.replace(day=1), period=dif)
 
         sched.append(Amortization(date=zero_date, amortizes_interest=False))
-        sched.append(Amortization(date=anniversary_date or zero_date + _MONTH * term, amortization_ratio=_1, price_level_adjustment=pla))
+        sched.append(Amortization(date=anniversary_date or due, amortization_ratio=_1, price_level_adjustment=pla))
 
         if anniversary_date:
             sched[-1].dct_override = DctOverride(anniversary_date, anniversary_date, predates_first_amortization=False)
@@ -2712,9 +3067,9 @@ def preprocess_bullet(
         lst = []
 
         lst.append(Amortization(date=zero_date, amortizes_interest=False))
-        lst.append(Amortization(date=anniversary_date or zero_date + _MONTH * term, amortization_ratio=_1))
+        lst.append(Amortization(date=anniversary_date or due, amortization_ratio=_1))
 
-        for skel in _interleave(lst, insertions, key=lambda x: x.date):
+        for skel in _interleave(lst, insertions, key=_DATE_KEY):
             sched.append(skel.item)
 
             if skel.from_a and vir and vir.code == 'IPCA':
@@ -2730,7 +3085,7 @@ def preprocess_bullet(
                 skel.item.dct_override = DctOverride(zero_date, anniversary_date, predates_first_amortization=True)
 
             elif skel.from_b:
-                skel.item.dct_override = DctOverride(zero_date, zero_date + _MONTH * term, predates_first_amortization=True)
+                skel.item.dct_override = DctOverride(zero_date, due, predates_first_amortization=True)
 
     return sched
 
@@ -2758,25 +3113,29 @@ def preprocess_jm(
     if vir and vir.code == 'Poupança':
         raise NotImplementedError('"Poupança" is currently unsupported')
 
+    # The last regular payment date. Computed once, not once per insertion.
+    last = anniversary_date + _MONTH * (term - 1) if anniversary_date else zero_date + _MONTH * term
+
     for i, x in enumerate(insertions):
         if x.date <= zero_date:
             raise ValueError(f'"insertions[{i}].date", {x.date}, must succeed "zero_date", {zero_date}')
 
-        elif not anniversary_date and x.date > (due := zero_date + _MONTH * term):
-            raise ValueError(f'"insertions[{i}].date", {x.date}, succeeds the last regular payment date, {due}')
-
-        elif anniversary_date and x.date > (due := anniversary_date + _MONTH * (term - 1)):
-            raise ValueError(f'"insertions[{i}].date", {x.date}, succeeds the last regular payment date, {due}')
+        elif x.date > last:
+            raise ValueError(f'"insertions[{i}].date", {x.date}, succeeds the last regular payment date, {last}')
 
     # 2. Create the amortizations.
     if anniversary_date and anniversary_date == zero_date + _MONTH:
         anniversary_date = None
 
+    # Base date of the price level adjustments, when the correction is settled only on the last payment. It's the same
+    # for all payments.
+    base = anniversary_date.replace(day=1) if anniversary_date else zero_date.replace(day=1) + _MONTH
+
     # Regular flow, without insertions. Fast.
     lst1.append(Amortization(date=zero_date, amortizes_interest=False))  # Data zero (início do rendimento).
 
     for i in range(1, term + 1):
-        due = anniversary_date + _MONTH * (i - 1) if anniversary_date else zero_date + _MONTH * i
+        due = _add_months(anniversary_date, i - 1) if anniversary_date else _add_months(zero_date, i)
         ent = Amortization(date=due, amortization_ratio=_0 if i != term else _1)
 
         if i == 1 and anniversary_date:
@@ -2829,7 +3188,7 @@ def preprocess_jm(
             ent.price_level_adjustment = PriceLevelAdjustment('IPCA')
 
             ent.price_level_adjustment.shift = 'M-2'
-            ent.price_level_adjustment.base_date = anniversary_date.replace(day=1) if anniversary_date else zero_date.replace(day=1) + _MONTH
+            ent.price_level_adjustment.base_date = base
             ent.price_level_adjustment.period = i
             ent.price_level_adjustment.amortizes_adjustment = i == term
 
@@ -2837,7 +3196,7 @@ def preprocess_jm(
 
     # Insertions in the regular flow. Slow.
     if insertions:
-        for skel in _interleave(lst1, insertions, key=lambda x: x.date):
+        for skel in _interleave(lst1, insertions, key=_DATE_KEY):
             lst2.append(skel.item)
 
             if skel.from_a and vir and vir.code == 'IPCA' and amortizes_correction:
@@ -2852,7 +3211,7 @@ def preprocess_jm(
                 skel.item.price_level_adjustment = PriceLevelAdjustment('IPCA')
 
                 skel.item.price_level_adjustment.shift = 'M-2'
-                skel.item.price_level_adjustment.base_date = anniversary_date.replace(day=1) if anniversary_date else zero_date.replace(day=1) + _MONTH
+                skel.item.price_level_adjustment.base_date = base
                 skel.item.price_level_adjustment.period = skel.index_a
                 skel.item.price_level_adjustment.amortizes_adjustment = True  # Redundant, since monetary correction is always settled on insertions.
 
@@ -2887,15 +3246,15 @@ def preprocess_price(
     elif anniversary_date and abs((anniversary_date - (zero_date + _MONTH)).days) > 20:
         raise ValueError(f'the "anniversary_date", {anniversary_date}, is more than 20 days away from the regular payment date, {zero_date + _MONTH}')
 
+    # The last regular payment date. Computed once, not once per insertion.
+    last = anniversary_date + _MONTH * (term - 1) if anniversary_date else zero_date + _MONTH * term
+
     for i, x in enumerate(insertions):
         if x.date <= zero_date:
             raise ValueError(f'"insertions[{i}].date", {x.date}, must succeed "zero_date", {zero_date}')
 
-        elif not anniversary_date and x.date > (due := zero_date + _MONTH * term):
-            raise ValueError(f'"insertions[{i}].date", {x.date}, succeeds the last regular payment date, {due}')
-
-        elif anniversary_date and x.date > (due := anniversary_date + _MONTH * (term - 1)):
-            raise ValueError(f'"insertions[{i}].date", {x.date}, succeeds the last regular payment date, {due}')
+        elif x.date > last:
+            raise ValueError(f'"insertions[{i}].date", {x.date}, succeeds the last regular payment date, {last}')
 
     # 2. Create the amortizations.
     if anniversary_date and anniversary_date == zero_date + _MONTH:
@@ -2905,7 +3264,7 @@ def preprocess_price(
     lst1.append(Amortization(date=zero_date, amortizes_interest=False))  # Data zero (início do rendimento).
 
     for i, y in enumerate(amortize_fixed(principal, apy, term), 1):
-        due = anniversary_date + _MONTH * (i - 1) if anniversary_date else zero_date + _MONTH * i
+        due = _add_months(anniversary_date, i - 1) if anniversary_date else _add_months(zero_date, i)
 
         lst1.append(Amortization(date=due, amortization_ratio=y))
 
@@ -2914,7 +3273,7 @@ def preprocess_price(
 
     # Insertions in the regular flow. Slow.
     if insertions:
-        for skel in _interleave(lst1, insertions, key=lambda x: x.date):
+        for skel in _interleave(lst1, insertions, key=_DATE_KEY):
             lst2.append(skel.item)
 
             if skel.from_b:
@@ -2933,6 +3292,7 @@ def preprocess_livre(
     vir: t.Optional[VariableIndex] = None
 ) -> t.List[Amortization | Amortization.Bare]:
     sched: t.List[Amortization | Amortization.Bare] = []
+    dates: t.Set[datetime.date] = set()
     aux = _0
 
     # 1. Validate.
@@ -2945,7 +3305,9 @@ def preprocess_livre(
     for i, x in enumerate(amortizations):
         aux += x.amortization_ratio
 
-        if vir and vir.code not in t.get_args(_PL_INDEX) and type(x) is Amortization and x.price_level_adjustment:
+        dates.add(x.date)
+
+        if vir and vir.code not in _PL_INDEX_CODES and type(x) is Amortization and x.price_level_adjustment:
             raise TypeError(f"amortization {i} has price level adjustment, but a variable index wasn't provided, or isn't IPCA nor IGPM")
 
     for i, y in enumerate(insertions):
@@ -2961,7 +3323,8 @@ def preprocess_livre(
     if abs((amortizations[1].date - (amortizations[0].date + _MONTH)).days) > 20:
         raise ValueError(f'the first payment date, {amortizations[1].date}, is more than 20 days away from the regular payment date, {amortizations[0].date + _MONTH}')
 
-    if len(set([z.date for z in amortizations])) != len(amortizations):
+    # The dates were collected on the loop above. The check stays here, so that the validations keep their order.
+    if len(dates) != len(amortizations):
         raise ValueError('amortization dates must be unique.')
 
     if not math.isclose(aux, _1):
@@ -2972,7 +3335,7 @@ def preprocess_livre(
         sched.extend(amortizations)
 
     else:  # Extraordinary flow, with insertions.
-        for skel in _interleave(amortizations, insertions, key=lambda x: x.date):
+        for skel in _interleave(amortizations, insertions, key=_DATE_KEY):
             if skel.from_a:
                 sched.append(skel.item)
 
@@ -2989,7 +3352,7 @@ def preprocess_livre(
     return sched
 
 # FIXME: renomear para "get_bullet_payments".
-@typeguard.typechecked
+@_typechecked
 def build_bullet(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -3056,7 +3419,7 @@ def build_bullet(
 get_bullet_payments = build_bullet
 
 # FIXME: renomear para "get_jm_payments".
-@typeguard.typechecked
+@_typechecked
 def build_jm(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -3119,7 +3482,7 @@ def build_jm(
 get_jm_payments = build_jm
 
 # FIXME: renomear para "get_price_payments".
-@typeguard.typechecked
+@_typechecked
 def build_price(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -3179,7 +3542,7 @@ def build_price(
 get_price_payments = build_price
 
 # FIXME: remove.
-@typeguard.typechecked
+@_typechecked
 def build(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -3225,7 +3588,7 @@ def build(
 
     yield from get_payments_table(**kwa)
 
-@typeguard.typechecked
+@_typechecked
 def get_bullet_daily_returns(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -3242,18 +3605,16 @@ def get_bullet_daily_returns(
     is_bizz_day_cb: t.Callable[[datetime.date], bool] = lambda _: True,
     verbose: bool = True
 ) -> t.Generator[DailyReturn, None, None]:
-    kwa: t.Dict[str, t.Any] = {}
-
-    kwa['principal'] = principal
-    kwa['apy'] = apy
-    kwa['amortizations'] = preprocess_bullet(zero_date, term, insertions, anniversary_date, capitalisation, vir, calc_date=None, verbose=verbose)
-    kwa['vir'] = vir
-    kwa['capitalisation'] = '252' if vir and vir.code == 'CDI' else capitalisation
-    kwa['is_bizz_day_cb'] = is_bizz_day_cb
-
-    yield from get_daily_returns(**kwa)
-
-@typeguard.typechecked
+    yield from get_daily_returns(
+        principal=principal,
+        apy=apy,
+        amortizations=preprocess_bullet(zero_date, term, insertions, anniversary_date, capitalisation, vir, calc_date=None, verbose=verbose),
+        vir=vir,
+        capitalisation='252' if vir and vir.code == 'CDI' else capitalisation,
+        is_bizz_day_cb=is_bizz_day_cb
+    )
+
+@_typechecked
 def get_jm_daily_returns(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -3265,18 +3626,16 @@ def get_jm_daily_returns(
     amortizes_correction: bool = True,
     is_bizz_day_cb: t.Callable[[datetime.date], bool] = lambda _: True
 ) -> t.Generator[DailyReturn, None, None]:
-    kwa: t.Dict[str, t.Any] = {}
-
-    kwa['principal'] = principal
-    kwa['apy'] = apy
-    kwa['amortizations'] = preprocess_jm(zero_date, term, insertions, anniversary_date, vir, amortizes_correction=amortizes_correction)
-    kwa['vir'] = vir
-    kwa['capitalisation'] = '252' if vir and vir.code == 'CDI' else '30/360'
-    kwa['is_bizz_day_cb'] = is_bizz_day_cb
-
-    yield from get_daily_returns(**kwa)
-
-@typeguard.typechecked
+    yield from get_daily_returns(
+        principal=principal,
+        apy=apy,
+        amortizations=preprocess_jm(zero_date, term, insertions, anniversary_date, vir, amortizes_correction=amortizes_correction),
+        vir=vir,
+        capitalisation='252' if vir and vir.code == 'CDI' else '30/360',
+        is_bizz_day_cb=is_bizz_day_cb
+    )
+
+@_typechecked
 def get_price_daily_returns(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -3286,18 +3645,16 @@ def get_price_daily_returns(
     anniversary_date: t.Optional[datetime.date] = None,
     is_bizz_day_cb: t.Callable[[datetime.date], bool] = lambda _: True
 ) -> t.Generator[DailyReturn, None, None]:
-    kwa: t.Dict[str, t.Any] = {}
-
-    kwa['principal'] = principal
-    kwa['apy'] = apy
-    kwa['amortizations'] = preprocess_price(principal, apy, zero_date, term, insertions, anniversary_date)
-    kwa['capitalisation'] = '30/360'
-    kwa['is_bizz_day_cb'] = is_bizz_day_cb
-
-    yield from get_daily_returns(**kwa)
+    yield from get_daily_returns(
+        principal=principal,
+        apy=apy,
+        amortizations=preprocess_price(principal, apy, zero_date, term, insertions, anniversary_date),
+        capitalisation='30/360',
+        is_bizz_day_cb=is_bizz_day_cb
+    )
 
 # FIXME: remove.
-@typeguard.typechecked
+@_typechecked
 def get_livre_daily_returns(
     principal: decimal.Decimal,
     apy: decimal.Decimal,
@@ -3306,39 +3663,36 @@ def get_livre_daily_returns(
     vir: t.Optional[VariableIndex] = None,
     is_bizz_day_cb: t.Callable[[datetime.date], bool] = lambda _: True
 ) -> t.Generator[DailyReturn, None, None]:
-    kwa: t.Dict[str, t.Any] = {}
-
-    kwa['principal'] = principal
-    kwa['apy'] = apy
-    kwa['vir'] = vir
-    kwa['amortizations'] = preprocess_livre(amortizations, insertions, vir)
-    kwa['capitalisation'] = '252' if vir and vir.code == 'CDI' else '30/360'
-    kwa['is_bizz_day_cb'] = is_bizz_day_cb
-
-    yield from get_daily_returns(**kwa)
+    yield from get_daily_returns(
+        principal=principal,
+        apy=apy,
+        vir=vir,
+        amortizations=preprocess_livre(amortizations, insertions, vir),
+        capitalisation='252' if vir and vir.code == 'CDI' else '30/360',
+        is_bizz_day_cb=is_bizz_day_cb
+    )
 # }}}
 
 # Public API. Helpers. {{{
-@typeguard.typechecked
+#
+# The helpers below are not type checked. They are small, and are called for every payment, or every late payment, by
+# the routines above, which check their own arguments.
+#
+@functools.lru_cache(maxsize=4096)
 def calculate_revenue_tax(begin: datetime.date, end: datetime.date) -> decimal.Decimal:
     '''Calculates tax for fixed income.'''
 
     if end > begin:
-        dif = (end - begin).days
-
-        for minimum, maximum, rate in _BRAZIL_TAX_BRACKETS:
-            if minimum < dif <= maximum:
-                return rate
+        return _BRAZIL_TAX_RATES[bisect.bisect_left(_BRAZIL_TAX_EDGES, (end - begin).days)]
 
     raise ValueError(f'end date, {end}, should be grater than the begin date, {begin}.')
 
 @functools.cache
-@typeguard.typechecked
 def calculate_interest_factor(rate: decimal.Decimal, period: decimal.Decimal, percent: bool = True) -> decimal.Decimal:
     '''Calculates the interest factor given an annual percentage rate (APY) and a period.'''
 
     if percent:
-        rate = decimal.Decimal(rate) / decimal.Decimal(100)
+        rate = decimal.Decimal(rate) / _100
 
     if rate:
         return (_1 + rate) ** decimal.Decimal(period)
@@ -3346,7 +3700,6 @@ def calculate_interest_factor(rate: decimal.Decimal, period: decimal.Decimal, pe
     else:
         return _1
 
-@typeguard.typechecked
 def calculate_iof(begin: datetime.date, term: int) -> decimal.Decimal:
     '''
     Calculates the IOF for a fixed income investment.
@@ -3356,15 +3709,13 @@ def calculate_iof(begin: datetime.date, term: int) -> decimal.Decimal:
     '''
 
     if term >= 12:
-        return decimal.Decimal('1.88')
+        return _IOF_CAP
 
     else:
-        data2 = begin + _MONTH * term
-        delta = (data2 - begin).days
+        delta = (_add_months(begin, term) - begin).days
 
-        return decimal.Decimal('0.38') + decimal.Decimal('0.00411') * delta
+        return _IOF_FIXED + _IOF_DAILY * delta
 
-@typeguard.typechecked
 def amortize_fixed(principal: decimal.Decimal, apy: decimal.Decimal, term: int) -> t.Generator[decimal.Decimal, None, None]:
     '''
     Builds an amortization table for a fixed income investment.
@@ -3373,18 +3724,19 @@ def amortize_fixed(principal: decimal.Decimal, apy: decimal.Decimal, term: int)
     '''
 
     if term > 0:
-        fac = calculate_interest_factor(apy, _1 / decimal.Decimal(12))
-        pmt = (principal * (fac - _1)) / (_1 - pow(fac, -term))
+        fac = calculate_interest_factor(apy, _fraction(1, 12))
+        rate = fac - _1  # The monthly rate, the same on every period.
+        pmt = (principal * rate) / (_1 - pow(fac, -term))
         bal = principal
 
         while bal > 0:
-            amr = pmt - (bal * (fac - _1)) if bal - pmt >= 0 else bal
+            amr = pmt - (bal * rate) if bal >= pmt else bal
             bal = bal - amr
 
             yield amr / principal
 
 # FIXME: the routine does not support IPCA.
-@typeguard.typechecked
+@_typechecked
 def get_delinquency_charges(
     outstanding_balance: decimal.Decimal,  # Unpaid principal plus interest.
     arrears_period: t.Tuple[datetime.date, datetime.date],  # Arrear, or delinquency period.
@@ -3450,29 +3802,33 @@ def get_delinquency_charges(
     #
     # The fine is fixed ("fine_rate"). The factor does not vary according to the length of the delay period.
     #
+    # The fee and the fine rates as ratios. The default rates have theirs precomputed, as most late payments use them.
+    fee = _FEE_RATIO if fee_rate is _FEE_RATE else fee_rate / _100
+    fine = _FINE_RATIO if fine_rate is _FINE_RATE else fine_rate / _100
+
     f_1 = f_2 = f_3 = _1
 
     if not loan_vir:
         dcp = decimal.Decimal((arrears_period[1] - arrears_period[0]).days)
-        f_1 = calculate_interest_factor(loan_apy, dcp / decimal.Decimal(360))
-        f_2 = _1 + (fee_rate / decimal.Decimal(100)) * (dcp / decimal.Decimal(30))
-        f_3 = _1 + (fine_rate / decimal.Decimal(100))
+        f_1 = calculate_interest_factor(loan_apy, _fraction(int(dcp), 360))
+        f_2 = _1 + fee * (dcp / _30)
+        f_3 = _1 + fine
 
     elif loan_vir and loan_vir.code == 'CDI':
         dcp = decimal.Decimal((arrears_period[1] - arrears_period[0]).days)
         fv1 = loan_vir.backend.calculate_cdi_factor(arrears_period[0], arrears_period[1], loan_vir.percentage)
-        f_s = calculate_interest_factor(loan_apy, decimal.Decimal(fv1.amount) / decimal.Decimal(252))
+        f_s = calculate_interest_factor(loan_apy, _fraction(fv1.amount, 252))
         f_1 = fv1.value * f_s
-        f_2 = _1 + (fee_rate / decimal.Decimal(100)) * (dcp / decimal.Decimal(30))
-        f_3 = _1 + (fine_rate / decimal.Decimal(100))
+        f_2 = _1 + fee * (dcp / _30)
+        f_3 = _1 + fine
 
     elif loan_vir and loan_vir.code == 'IPCA':
         dcp = decimal.Decimal((arrears_period[1] - arrears_period[0]).days)
         fv2 = _1  # Como calcular o IPCA, "loan_vir.backend.calculate_ipca_factor(…)"?
-        f_s = calculate_interest_factor(loan_apy, dcp / decimal.Decimal(360))
+        f_s = calculate_interest_factor(loan_apy, _fraction(int(dcp), 360))
         f_1 = fv2 * f_s
-        f_2 = _1 + (fee_rate / decimal.Decimal(100)) * (dcp / decimal.Decimal(30))
-        f_3 = _1 + (fine_rate / decimal.Decimal(100))
+        f_2 = _1 + fee * (dcp / _30)
+        f_3 = _1 + fine
 
     elif loan_vir and loan_vir.code == 'Poupança':
         raise NotImplementedError()  # FIXME: implement.
@@ -3494,7 +3850,7 @@ def get_delinquency_charges(
 # FIXME: remove this routine. Create an auxiliary in the modules that need to handle a delayed payment entering and
 # exiting. Such auxiliary should use the "get_delinquency_charges" routine to calculate the values of the delay.
 #
-@typeguard.typechecked
+@_typechecked
 def get_late_payment(
     in_pmt: t.Union[LatePayment, LatePriceAdjustedPayment],
 
@@ -3515,27 +3871,31 @@ def get_late_payment(
 ) -> t.Union[LatePayment, LatePriceAdjustedPayment]:
     '''Generates a late payment output.'''
 
+    # The fee and the fine rates as ratios. The default rates have theirs precomputed, as most late payments use them.
+    fee = _FEE_RATIO if fee_rate is _FEE_RATE else fee_rate / _100
+    fine = _FINE_RATIO if fine_rate is _FINE_RATE else fine_rate / _100
+
     f_1 = f_2 = f_3 = f_c = _1
 
     if not vir:
         dcp = decimal.Decimal((calc_date - in_pmt.date).days)
-        f_1 = calculate_interest_factor(apy, dcp / decimal.Decimal(360))
-        f_2 = _1 + (fee_rate / decimal.Decimal(100) * dcp / decimal.Decimal(30))
-        f_3 = _1 + (fine_rate / decimal.Decimal(100)) if in_pmt.date < calc_date else _1
+        f_1 = calculate_interest_factor(apy, _fraction(int(dcp), 360))
+        f_2 = _1 + (fee * dcp / _30)
+        f_3 = _1 + fine if in_pmt.date < calc_date else _1
 
     elif vir and vir.code == 'CDI':
         dcp = decimal.Decimal((calc_date - in_pmt.date).days)
         f_v = vir.backend.calculate_cdi_factor(in_pmt.date, calc_date, vir.percentage)
-        f_s = calculate_interest_factor(apy, decimal.Decimal(f_v.amount) / decimal.Decimal(252))
+        f_s = calculate_interest_factor(apy, _fraction(f_v.amount, 252))
         f_1 = f_v.value * f_s
-        f_2 = _1 + (fee_rate / decimal.Decimal(100) * dcp / decimal.Decimal(30))
-        f_3 = _1 + (fine_rate / decimal.Decimal(100)) if in_pmt.date < calc_date else _1
+        f_2 = _1 + (fee * dcp / _30)
+        f_3 = _1 + fine if in_pmt.date < calc_date else _1
 
     elif vir and vir.code == 'IPCA':
         dcp = decimal.Decimal((calc_date - in_pmt.date).days)
-        f_1 = calculate_interest_factor(apy, dcp / decimal.Decimal(360))
-        f_2 = _1 + (fee_rate / decimal.Decimal(100) * dcp / decimal.Decimal(30))
-        f_3 = _1 + (fine_rate / decimal.Decimal(100)) if in_pmt.date < calc_date else _1
+        f_1 = calculate_interest_factor(apy, _fraction(int(dcp), 360))
+        f_2 = _1 + (fee * dcp / _30)
+        f_3 = _1 + fine if in_pmt.date < calc_date else _1
         f_c = _1
 
         # Composition of the "pla_operations" parameter:
@@ -3593,8 +3953,8 @@ def get_late_payment(
         penalty = _Q(in_pmt.penalty * f_c)
         fine = _Q(in_pmt.fine * f_c)
 
-        if type(in_pmt) is LatePriceAdjustedPayment:
-            pla = _Q(in_pmt.pla + (in_pmt.amort + in_pmt.pla) * (f_c - _1))
+        # A plain late payment carries no prior price level adjustment to be corrected.
+        pla = _Q(in_pmt.pla + (in_pmt.amort + in_pmt.pla) * (f_c - _1)) if type(in_pmt) is LatePriceAdjustedPayment else _0
 
         v_1 = (raw) * (f_1 - _1)  # Value of interest.
         v_2 = (raw + v_1) * (f_2 - _1)  # Value of penalty interest.
@@ -3615,10 +3975,7 @@ def get_late_payment(
         o_2.gain = in_pmt.gain
         o_2.amort = in_pmt.amort
         o_2.bal = in_pmt.bal
-
-        if type(in_pmt) is LatePriceAdjustedPayment:
-            o_2.pla = pla
-
+        o_2.pla = pla
         o_2.extra_gain = extra_gain + v_1 + (gain - in_pmt.gain)
         o_2.penalty = penalty + v_2
         o_2.fine = fine + v_3
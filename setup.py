@@ -15,5 +15,5 @@ setup(
         'Operating System :: OS Independent',
     ],
     install_requires=['typeguard', 'python-dateutil'],
-    python_requires='>=3.9'
+    python_requires='>=3.10'
 )
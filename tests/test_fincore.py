@@ -13,6 +13,8 @@
 '''Fincore test module.'''
 
 # Core.
+import gc
+import copy
 import math
 import types
 import typing as t
@@ -22,6 +24,8 @@ import datetime
 import functools
 import itertools
 import collections
+import dataclasses
+import weakref
 import unittest.mock
 
 # Libs.
@@ -529,6 +533,24 @@ def test_wont_create_sched_6():
 
     with pytest.raises(Exception, match='the value of the amortization, 150000, is greater than the remaining balance of the loan, 102081.39'):
         next(fincore.get_payments_table(**kwa))
+
+def test_wont_create_sched_7():
+    '''Fincore deve falhar ao criar um empréstimo com uma combinação de índice e base não suportada.'''
+
+    ent0 = fincore.Amortization(date=datetime.date(2018, 1, 1))
+    ent1 = fincore.Amortization(date=datetime.date(2018, 5, 1), amortizes_interest=True)
+
+    with pytest.raises(NotImplementedError, match='Combination of variable interest rate .* and capitalisation 360 unsupported'):
+        next(fincore.get_payments_table(_1, _0, [ent0, ent1], vir=fincore.VariableIndex('IGPM'), capitalisation='360'))
+
+def test_wont_create_daily_returns_1():
+    '''Fincore deve falhar ao criar os rendimentos diários de uma combinação de índice e base não suportada.'''
+
+    ent0 = fincore.Amortization(date=datetime.date(2018, 1, 1))
+    ent1 = fincore.Amortization(date=datetime.date(2018, 5, 1), amortization_ratio=_1, amortizes_interest=True)
+
+    with pytest.raises(NotImplementedError, match='combination of variable interest rate .* and capitalisation 30/360 unsupported'):
+        next(fincore.get_daily_returns(_1, _0, [ent0, ent1], vir=fincore.VariableIndex('Poupança'), capitalisation='30/360'))
 # }}}
 
 # 🎈 Bullets. {{{
@@ -4221,6 +4243,194 @@ def test_wont_calculate_revenue_tax():
 def test_will_calculate_revenue_tax(begin_date, end_date, tax):
     assert fincore.calculate_revenue_tax(begin_date, end_date) == tax
 
+@pytest.mark.parametrize('begin_date, term, iof', [
+    (datetime.date(2024, 1, 31), 1, decimal.Decimal('0.49919')),  # 29 dias, fevereiro bissexto.
+    (datetime.date(2023, 1, 31), 1, decimal.Decimal('0.49508')),  # 28 dias.
+    (datetime.date(2023, 12, 15), 3, decimal.Decimal('0.75401')),  # 91 dias, virando o ano.
+    (datetime.date(2023, 12, 15), 12, decimal.Decimal('1.88'))
+])
+def test_will_calculate_iof(begin_date, term, iof):
+    assert fincore.calculate_iof(begin_date, term) == iof
+
+def test_will_normalize_factor_triplets():
+    acc = fincore.FactorTriplet(decimal.Decimal('2'), decimal.Decimal('3'), decimal.Decimal('1.5'), decimal.Decimal('1.00'))
+    new = fincore.FactorTriplet(decimal.Decimal('4.00'), decimal.Decimal('6.00'), decimal.Decimal('1.5'), decimal.Decimal('1'))
+
+    # Normalizadores iguais, mas escritos de forma diferente, geram um novo trio, com os expoentes do acumulador.
+    out = acc.normalize(new)
+
+    assert out is not new
+    assert str(new.value) == '6.00'
+    assert str(out.value) == '6'
+
+    # Já o mesmo normalizador devolve o próprio trio.
+    assert acc.normalize(out) is out
+
+def test_will_memoize_in_memory_factors():
+    bend = fincore.InMemoryBackend(memoize=True)
+    args = datetime.date(2020, 1, 2), datetime.date(2021, 1, 4), 110
+
+    for calc in [bend.calculate_cdi_factor, bend.calculate_savings_factor]:
+        out1 = calc(*args)
+        out2 = calc(*args)
+
+        assert out1 == out2
+        assert out1 is not out2
+
+    # Cached or not, arguments of the wrong type are still rejected.
+    for calc in [bend.calculate_cdi_factor, bend.calculate_savings_factor]:
+        with pytest.raises(typeguard.TypeCheckError, match=r'argument "percentage" \(float\) is not an instance of int'):
+            calc(*args[:2], 110.0)  # pyright: ignore
+
+    # O backend padrão, compartilhado por todos os cronogramas, não memoriza.
+    bend = fincore.VariableIndex().backend
+
+    assert isinstance(bend, fincore.InMemoryBackend)
+    assert bend.calculate_cdi_factor(*args) == bend.calculate_cdi_factor(*args)
+    assert not bend._memo_cdi
+
+def test_wont_memoize_in_memory_factors_with_warnings(caplog):
+    bend = fincore.InMemoryBackend(memoize=True)
+
+    # Fatores com índices ausentes não são memorizados, e os avisos são emitidos em toda chamada.
+    for _ in range(2):
+        bend.calculate_cdi_factor(datetime.date(2035, 1, 1), datetime.date(2035, 1, 2))
+        bend.calculate_savings_factor(datetime.date(2035, 1, 1), datetime.date(2035, 3, 4))
+
+    assert [x.message for x in caplog.records] == ['CDI index for date 2035-01-01 was not found', 'no Savings indexes found between 2035-01 and 2035-03'] * 2
+
+    # Com o log de depuração ligado, os índices são emitidos em toda chamada.
+    args = datetime.date(2020, 1, 2), datetime.date(2020, 1, 4)
+    out1 = bend.calculate_cdi_factor(*args)
+
+    caplog.clear()
+
+    with caplog.at_level(logging.DEBUG, logger='fincore'):
+        out2 = bend.calculate_cdi_factor(*args)
+        out3 = bend.calculate_cdi_factor(*args)
+
+    assert out1 == out2 == out3
+    assert len(caplog.records) == 4
+
+def test_will_renew_in_memory_factors():
+    bend = fincore.InMemoryBackend(memoize=True)
+    args = datetime.date(2020, 1, 2), datetime.date(2020, 1, 4)
+    out1 = bend.calculate_cdi_factor(*args)
+
+    # A memória é descartada por "cache_clear", depois de alterado um registro da instância.
+    bend._registry_cdi = [(datetime.date(2017, 12, 29), datetime.date(2020, 12, 31), decimal.Decimal('0.1'))]
+
+    assert bend.calculate_cdi_factor(*args) == out1
+
+    bend.cache_clear()
+
+    out2 = bend.calculate_cdi_factor(*args)
+
+    assert out1.amount == out2.amount == 2
+    assert out2.value == decimal.Decimal('1.001') ** 2
+
+    # Inclusive quando o registro é alterado no lugar.
+    bend._registry_cdi[0] = (datetime.date(2017, 12, 29), datetime.date(2020, 12, 31), decimal.Decimal('0.2'))
+    bend.cache_clear()
+
+    assert bend.calculate_cdi_factor(*args).value == decimal.Decimal('1.002') ** 2
+
+    # A memória pertence à instância, e não a mantém viva.
+    ref = weakref.ref(bend)
+
+    del bend
+
+    gc.collect()
+
+    assert ref() is None
+
+def test_will_memoize_in_memory_ipca_factors(caplog):
+    bend = fincore.InMemoryBackend(memoize=True)
+    args = datetime.date(2022, 1, 1), 12, 'AUTO', decimal.Decimal('0.5')
+    out1 = bend.calculate_ipca_factor(*args)
+    out2 = bend.calculate_ipca_factor(*args)
+
+    assert out1 == out2
+    assert out1.mem is not out2.mem
+    assert out1.mem[0] is not out2.mem[0]
+
+    # Razões iguais, com expoentes diferentes, não compartilham a memória.
+    out3 = bend.calculate_ipca_factor(*args[:3], decimal.Decimal('0.50'))
+    out4 = fincore.IndexStorageBackend.calculate_ipca_factor(bend, *args[:3], decimal.Decimal('0.50'))
+
+    assert str(out3.value) == str(out4.value)
+
+    # Fatores sem índices não são memorizados, e o aviso é emitido em toda chamada.
+    bend.calculate_ipca_factor(datetime.date(1990, 1, 1), 1, 'M-1')
+    bend.calculate_ipca_factor(datetime.date(1990, 1, 1), 1, 'M-1')
+
+    assert len(caplog.records) == 2
+    assert all(x.levelno == logging.WARNING and x.message.startswith('no IPCA indexes found') for x in caplog.records)
+
+    with pytest.raises(typeguard.TypeCheckError):
+        bend.calculate_ipca_factor(datetime.date(2022, 1, 1), 12.0, 'AUTO')  # pyright: ignore
+
+def test_will_reduce_in_memory_cdi_by_range():
+    bend = fincore.InMemoryBackend()
+
+    for args in [(datetime.date(2018, 1, 2), datetime.date(2022, 1, 3), 100), (datetime.date(2020, 2, 20), datetime.date(2020, 3, 2), 115)]:
+        out1 = bend.calculate_cdi_factor(*args)
+        out2 = fincore.IndexStorageBackend.calculate_cdi_factor(bend, *args)
+
+        assert str(out1.value) == str(out2.value)
+        assert out1.amount == out2.amount
+
+    # Feriados definidos na instância valem tanto para os índices quanto para o fator reduzido.
+    args = datetime.date(2020, 4, 9), datetime.date(2020, 4, 14), 100
+
+    assert bend.calculate_cdi_factor(*args).amount == 2
+
+    bend._ignore_cdi = []
+
+    out1 = bend.calculate_cdi_factor(*args)
+    out2 = fincore.IndexStorageBackend.calculate_cdi_factor(bend, *args)
+
+    assert str(out1.value) == str(out2.value)
+    assert out1.amount == out2.amount == 3
+
+def test_will_snapshot_payment_registers():
+    kwa = {}
+
+    kwa['principal'] = decimal.Decimal(1000)
+    kwa['apy'] = decimal.Decimal(12)
+    kwa['amortizations'] = fincore.preprocess_jm(datetime.date(2022, 1, 1), 3)
+
+    pmts = list(fincore.get_payments_table(**kwa))
+
+    assert [x._regs.principal_amortized_total for x in pmts] == [_0, _0, decimal.Decimal(1000)]
+    assert pmts[0]._regs is not pmts[1]._regs
+    assert copy.copy(pmts[2]._regs) == pmts[2]._regs
+
+    # A cópia é feita campo a campo, e precisa acompanhar os campos dos registradores.
+    regs = fincore._Registers(*[decimal.Decimal(i) for i, _ in enumerate(dataclasses.fields(fincore._Registers))])
+    snap = copy.copy(regs)
+
+    assert snap is not regs
+    assert all(getattr(snap, x.name) == getattr(regs, x.name) for x in dataclasses.fields(fincore._Registers))
+
+def test_will_compare_bare_amortizations():
+    ovr = fincore.DctOverride(datetime.date(2022, 1, 1), datetime.date(2022, 2, 1), False)
+    a = fincore.Amortization.Bare(date=datetime.date(2022, 1, 5), value=decimal.Decimal('100'))
+    b = fincore.Amortization.Bare(date=datetime.date(2022, 1, 5), value=decimal.Decimal('100.00'))
+    c = fincore.Amortization.Bare(date=datetime.date(2022, 1, 5), value=decimal.Decimal('100'), dct_override=ovr)
+
+    # A igualdade considera todos os campos, inclusive o "dct_override".
+    assert a == b
+    assert a != c
+
+def test_will_skip_type_checking_when_disabled(monkeypatch):
+    def func(x: int) -> int:
+        return x
+
+    monkeypatch.setattr(fincore, '_TYPECHECK', False)
+
+    assert fincore._typechecked(func) is func
+
 def test_wont_create_late_payment():
     with pytest.raises(TypeError, match=r"get_late_payment\(\) missing 1 required positional argument: 'in_pmt'"):
         kwa = {}
@@ -4535,6 +4745,49 @@ def test_will_create_late_payment_ipca():
         assert out.tax == decimal.Decimal('23.19')
         assert out.net == decimal.Decimal('1220.41')
         assert out.bal == pmt.bal
+
+def test_will_create_late_payment_ipca_from_plain_late_payment():
+    '''
+    Operação na base 30/360.
+
+    Testa se um pagamento em atraso sem correção monetária prévia é aceito, partindo de uma correção nula.
+    '''
+
+    pmt = fincore.LatePayment()
+    pla = fincore.PriceLevelAdjustment('IPCA')
+    sns = types.SimpleNamespace(value=decimal.Decimal('-0.001'), mem=[])
+    kwa = {}
+
+    pla.base_date = datetime.date(2022, 1, 1)
+    pla.period = 1
+    pla.shift = 'M-1'
+    pla.amortizes_adjustment = True
+
+    # Given.
+    pmt.date = datetime.date(2021, 10, 1)
+    pmt.bal = _0
+    pmt.raw = decimal.Decimal('1123.72')
+    pmt.amort = decimal.Decimal('1111.11')
+    pmt.gain = decimal.Decimal('12.61')
+
+    kwa['in_pmt'] = pmt
+    kwa['apy'] = decimal.Decimal('14.5')
+    kwa['zero_date'] = datetime.date(2021, 1, 1)
+    kwa['calc_date'] = datetime.date(2022, 1, 25)
+    kwa['vir'] = fincore.VariableIndex('IPCA')
+    kwa['pla_operations'] = [(kwa['calc_date'], True, pla)]
+
+    with unittest.mock.patch('fincore.IndexStorageBackend.calculate_ipca_factor', return_value=sns):
+        # When.
+        out = fincore.get_late_payment(**kwa)
+
+        # Then.
+        assert type(out) is fincore.LatePriceAdjustedPayment
+
+        assert out.pla == _0
+        assert out.raw == decimal.Decimal('1243.60')
+        assert out.tax == decimal.Decimal('23.19')
+        assert out.net == decimal.Decimal('1220.41')
 # }}}
 
 # Retornos diários. {{{